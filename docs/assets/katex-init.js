@@ -0,0 +1,12 @@
+// KaTeX auto-render bootstrap shared by every generated page.
+window.addEventListener('DOMContentLoaded', () => {
+  if (window.renderMathInElement) {
+    window.renderMathInElement(document.body, {
+      delimiters: [
+        {left: '$$', right: '$$', display: true},
+        {left: '$', right: '$', display: false},
+      ],
+      throwOnError: false,
+    });
+  }
+});
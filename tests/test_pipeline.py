@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import importlib.util
+import io
 import json
+import os
+import re
+import shutil
+import sys
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
@@ -27,6 +34,47 @@ def _write_json(path: Path, payload: dict) -> None:
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
+def _load_tool_copy(repo_root: Path, name: str, monkeypatch: pytest.MonkeyPatch):
+    """Load a copy of tools/<name>.py placed under ``repo_root`` so its REPO paths point there."""
+    tools_dir = repo_root / "tools"
+    tools_dir.mkdir(parents=True, exist_ok=True)
+    for fname in (f"{name}.py", "jsonio.py"):
+        shutil.copyfile(REPO_ROOT / "tools" / fname, tools_dir / fname)
+    module_name = f"{name}_under_test"
+    spec = importlib.util.spec_from_file_location(module_name, tools_dir / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Registered so worker processes and dataclasses can resolve the module by name.
+    monkeypatch.setitem(sys.modules, module_name, module)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    spec.loader.exec_module(module)
+    return module
+
+
+def _seed_site_data(repo_root: Path) -> None:
+    entries = [
+        {
+            "id": f"eq-{n}",
+            "name": f"Equation {n}",
+            "equationLatex": f"x_{n} = {n}",
+            "description": f"Entry {n}",
+            "score": 90 - n,
+            "source": "test",
+            "units": "OK",
+            "theory": "PASS",
+            "date": "2026-03-21",
+            "firstSeen": "2026-03",
+            "assumptions": ["Linear regime"],
+        }
+        for n in range(3)
+    ]
+    _write_json(repo_root / "data" / "equations.json", {"entries": entries})
+    _write_json(repo_root / "data" / "submissions.json", {"entries": []})
+    _write_json(repo_root / "data" / "core.json", {"entries": []})
+    _write_json(repo_root / "data" / "certificates" / "equation_certificates.json", {"entries": []})
+    _write_json(repo_root / "data" / "certificates" / "chain_publish_receipt.json", {})
+
+
 def test_heuristic_score_computation_is_stable() -> None:
     entry = {
         "equationLatex": r"x = \\frac{1}{2}\\sin(t)",
@@ -202,4 +250,223 @@ def test_site_build_smoke_and_leaderboard_consistency(tmp_path: Path) -> None:
     assert "Threshold Equation" in leaderboard_html
     assert "Rising Equation" not in leaderboard_html
     assert "Machine-Readable Exports" in index_html
-    assert "./data/equations.json" in index_html
\ No newline at end of file
+    assert "./data/equations.json" in index_html
+
+
+def test_needs_rebuild_compares_output_and_input_mtimes(tmp_path: Path) -> None:
+    src = tmp_path / "in.json"
+    out = tmp_path / "out.html"
+    src.write_text("{}", encoding="utf-8")
+
+    assert build_site._needs_rebuild([out], [src])
+
+    out.write_text("<p></p>", encoding="utf-8")
+    os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(out, ns=(2_000_000_000, 2_000_000_000))
+    assert not build_site._needs_rebuild([out], [src, tmp_path / "missing.json"])
+
+    os.utime(src, ns=(3_000_000_000, 3_000_000_000))
+    assert build_site._needs_rebuild([out], [src])
+
+
+def test_site_main_rebuilds_everything_unless_incremental(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    repo_root = tmp_path / "repo"
+    site = _load_tool_copy(repo_root, "build_site", monkeypatch)
+    _seed_site_data(repo_root)
+    # Inputs well in the past, so the freshly written pages are strictly newer.
+    for path in [*repo_root.rglob("*.json"), repo_root / "tools" / "build_site.py"]:
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    pages = len(site._PAGE_TARGETS)
+
+    site.main([])
+    assert f"({pages} rebuilt, 0 up to date)" in capsys.readouterr().out
+
+    site.main(["--incremental"])
+    assert f"(0 rebuilt, {pages} up to date)" in capsys.readouterr().out
+
+    # core.json feeds the index and core pages only.
+    os.utime(repo_root / "data" / "core.json")
+    site.main(["--incremental"])
+    assert f"(2 rebuilt, {pages - 2} up to date)" in capsys.readouterr().out
+
+    site.main([])
+    assert f"({pages} rebuilt, 0 up to date)" in capsys.readouterr().out
+
+
+def test_site_main_jobs_matches_sequential_build(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo_root = tmp_path / "repo"
+    site = _load_tool_copy(repo_root, "build_site", monkeypatch)
+    _seed_site_data(repo_root)
+    stamp = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}|\?v=\d+")
+
+    def pages() -> dict[str, str]:
+        return {
+            path.name: stamp.sub("", path.read_text(encoding="utf-8"))
+            for path in sorted((repo_root / "docs").glob("*.html"))
+        }
+
+    site.main([])
+    sequential = pages()
+    shutil.rmtree(repo_root / "docs")
+    shutil.rmtree(repo_root / ".cache", ignore_errors=True)
+    site.main(["--jobs", "2"])
+
+    assert pages() == sequential
+    assert "registry.html" in sequential
+
+
+class _StubTexRenderer:
+    """Stands in for _TexRenderer; ``html=None`` simulates a missing node/katex."""
+
+    def __init__(self, html: str | None) -> None:
+        self.html = html
+        self.fallbacks = 0
+
+    def render(self, tex: str) -> str | None:
+        if self.html is None:
+            self.fallbacks += 1
+        return self.html
+
+
+def _cached_cards(repo_root: Path) -> dict[str, str]:
+    return json.loads(build_site._card_cache_path(repo_root).read_text(encoding="utf-8"))["cards"]
+
+
+def test_registry_card_cache_reuses_cards_until_the_entry_changes(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    docs = repo_root / "docs"
+    _seed_site_data(repo_root)
+
+    build_site.build_leaderboard(repo_root, docs)
+    cards = _cached_cards(repo_root)
+    assert len(cards) == 3
+
+    # A cached card is served as-is on the next build.
+    cache_path = build_site._card_cache_path(repo_root)
+    planted = {key: f"<section class='card'>cached {n}</section>" for n, key in enumerate(cards)}
+    cache_path.write_text(json.dumps({"salt": build_site._CARD_CACHE_SALT, "cards": planted}), encoding="utf-8")
+    build_site.build_leaderboard(repo_root, docs)
+    html = (docs / "registry.html").read_text(encoding="utf-8")
+    assert "cached 0" in html and "cached 2" in html
+
+    # Editing an entry changes its key, so only that card is rendered again.
+    equations = json.loads((repo_root / "data" / "equations.json").read_text(encoding="utf-8"))
+    equations["entries"][0]["name"] = "Renamed Equation"
+    _write_json(repo_root / "data" / "equations.json", equations)
+    build_site.build_leaderboard(repo_root, docs)
+    html = (docs / "registry.html").read_text(encoding="utf-8")
+    assert "Renamed Equation" in html
+    assert html.count("<section class='card'>cached") == 2
+
+    # A stale salt (template change) discards the whole cache.
+    cache_path.write_text(json.dumps({"salt": "stale", "cards": planted}), encoding="utf-8")
+    build_site.build_leaderboard(repo_root, docs)
+    assert "cached" not in (docs / "registry.html").read_text(encoding="utf-8")
+
+
+def test_registry_card_cache_skips_cards_whose_math_prerender_fell_back(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo_root = tmp_path / "repo"
+    docs = repo_root / "docs"
+    _seed_site_data(repo_root)
+
+    monkeypatch.setattr(build_site, "_tex_renderer", _StubTexRenderer(None))
+    build_site.build_leaderboard(repo_root, docs)
+    assert "$$x_0 = 0$$" in (docs / "registry.html").read_text(encoding="utf-8")
+    assert _cached_cards(repo_root) == {}
+
+    monkeypatch.setattr(build_site, "_tex_renderer", _StubTexRenderer("<span class='katex'>ok</span>"))
+    build_site.build_leaderboard(repo_root, docs)
+    assert "<span class='katex'>ok</span>" in (docs / "registry.html").read_text(encoding="utf-8")
+    assert len(_cached_cards(repo_root)) == 3
+
+
+def test_minifying_writer_matches_minify_html() -> None:
+    page = (
+        "<html>\n  <head>\n    <title> T </title>\n  </head>\n"
+        "<body>\n\n  <div class='a'>  text  </div>   \n"
+        "  <pre>\n  keep   <b> this </b>\n</pre>\n"
+        "  <script>\n  if (a > b) {  }  \n</script>\n"
+        "  <p>x</p>\t\n</body>\n</html>\n   "
+    )
+    protected = [m.span() for m in re.finditer(r"<pre\b.*?</pre>|<script\b.*?</script>", page, re.S)]
+    cuts = [i for i in range(1, len(page)) if not any(lo < i < hi for lo, hi in protected)]
+    expected = build_site._minify_html(page)
+
+    for i in cuts:
+        for j in (i, *cuts[cuts.index(i) + 1 :: 7]):
+            buf = io.StringIO()
+            writer = build_site._MinifyingWriter(buf)
+            for fragment in (page[:i], page[i:j], page[j:]):
+                writer.write(fragment)
+            writer.close()
+            assert buf.getvalue() == expected, (i, j)
+
+
+def test_harvest_files_jobs_keeps_walk_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    harvest = _load_tool_copy(tmp_path / "repo", "harvest_equations", monkeypatch)
+    root = tmp_path / "repos"
+    for n in range(12):
+        sub = root / f"r{n % 3}" / ("node_modules" if n == 5 else "src")
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"f{n}.md").write_text(f"$$ a_{n} + b_{n} = c_{n} $$\n", encoding="utf-8")
+        (sub / f"m{n}.py").write_text(f"y{n} = np.sin(x) * {n} + 1\n", encoding="utf-8")
+
+    sequential = harvest.harvest_files(root)
+    threaded = harvest.harvest_files(root, jobs=4)
+
+    assert threaded == sequential
+    sources = list(dict.fromkeys(h.source for h in sequential))
+    assert sources == [str(p) for p in harvest.iter_files(root)]
+    assert len(sources) == 22  # node_modules is skipped
+
+
+def test_generate_submitter_receipt_signs_each_requested_submission(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ecdsa = pytest.importorskip("ecdsa")
+    repo_root = tmp_path / "repo"
+    receipts = _load_tool_copy(repo_root, "generate_submitter_receipt", monkeypatch)
+    _write_json(
+        repo_root / "data" / "submissions.json",
+        {
+            "entries": [
+                {"submissionId": sid, "submitter": f"user-{sid}", "status": "promoted",
+                 "review": {"equationId": f"eq-{sid}", "score": 80}}
+                for sid in ("sub-1", "sub-2", "sub-3")
+            ]
+        },
+    )
+    _write_json(
+        repo_root / "data" / "certificates" / "equation_certificates.json",
+        {"entries": [{"token_id": "eq-sub-1", "equation_hash": "e1", "metadata_hash": "m1"}]},
+    )
+    sk = ecdsa.SigningKey.generate(curve=ecdsa.SECP256k1)
+    signer = tmp_path / "wallet.json"
+    _write_json(signer, {"private_key": sk.to_string().hex(), "public_key": sk.get_verifying_key().to_string().hex()})
+
+    monkeypatch.setattr(
+        sys, "argv",
+        ["generate_submitter_receipt.py", "--submission-ids", "sub-1", "sub-2", "--signer-file", str(signer)],
+    )
+    receipts.main()
+
+    out_dir = repo_root / "data" / "certificates" / "receipts"
+    assert sorted(p.name for p in out_dir.iterdir()) == ["receipt-sub-1.json", "receipt-sub-2.json"]
+    for sid in ("sub-1", "sub-2"):
+        receipt = json.loads((out_dir / f"receipt-{sid}.json").read_text(encoding="utf-8"))
+        signed = {k: v for k, v in receipt.items() if k not in ("signature", "verify_note")}
+        message = json.dumps(signed, sort_keys=True).encode("utf-8")
+        assert sk.get_verifying_key().verify(bytes.fromhex(receipt["signature"]), message)
+        assert receipt["submission_id"] == sid
+    assert json.loads((out_dir / "receipt-sub-1.json").read_text(encoding="utf-8"))["equation_hash"] == "e1"
+
+    monkeypatch.setattr(
+        sys, "argv",
+        ["generate_submitter_receipt.py", "--submission-ids", "sub-3", "nope", "--signer-file", str(signer)],
+    )
+    with pytest.raises(SystemExit, match="nope"):
+        receipts.main()
@@ -12,22 +12,77 @@ Generates:
 
 Usage:
   python tools/build_site.py
+  python tools/build_site.py --prerender-math   # needs node + the katex npm package
+  python tools/build_site.py --jobs 4           # build pages in parallel processes
+  python tools/build_site.py --incremental      # skip pages whose outputs are newer than their inputs
 
-This is intentionally dependency-free.
+This is intentionally dependency-free; orjson is used for data loads when installed.
 """
 
 from __future__ import annotations
 
+import argparse
+import functools
+import hashlib
 import html
 import json
 import re
 import shutil
+import string
+import subprocess
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
+from typing import Iterable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from jsonio import json_loads  # noqa: E402
+
+# html.escape (five C-level str.replace passes) measures 3-7x faster than a
+# single str.translate with a multi-character mapping table on card fields,
+# so it stays; only the str() coercion is skipped for the common str case.
+_html_escape = html.escape
 
 
 def _esc(s: object) -> str:
-    return html.escape(str(s) if s is not None else "")
+    kind = type(s)
+    if kind is str:
+        return _html_escape(s) if s else ""
+    if kind is int:
+        # Digits and an optional sign never need escaping.
+        return str(s)
+    if s is None:
+        return ""
+    return _html_escape(str(s))
+
+
+_ASCII_DIGITS = frozenset("0123456789")
+
+
+# Start of the current build. Captured once at import so builders called
+# directly share one stamp; main() refreshes it at the start of every run.
+_build_started = datetime.now()
+
+
+def _build_stamp() -> str:
+    return _build_started.strftime("%Y-%m-%d %H:%M")
+
+@functools.lru_cache(maxsize=32)
+def _parse_json_file(path_str: str, mtime_ns: int, size: int):
+    return json_loads(Path(path_str).read_bytes())
+
+
+def _load_json(path: Path):
+    """Parse a JSON file once per (path, mtime, size); builders share the result.
+
+    The returned object is shared between callers and must be treated as
+    read-only; copy before mutating.
+    """
+    st = path.stat()
+    return _parse_json_file(str(path), st.st_mtime_ns, st.st_size)
 
 
 def _load_json_safe(path: Path, default: dict | list | None = None):
@@ -35,10 +90,10 @@ def _load_json_safe(path: Path, default: dict | list | None = None):
   if default is None:
     default = {}
   try:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _load_json(path)
   except Exception:
     try:
-      raw = path.read_text(encoding="utf-8")
+      raw = path.read_bytes().decode("utf-8")
       dec = json.JSONDecoder()
       obj, _ = dec.raw_decode(raw)
       return obj
@@ -46,15 +101,74 @@ def _load_json_safe(path: Path, default: dict | list | None = None):
       return default
 
 
+# data/ files mirrored into docs/data by publish_machine_readable_data; the first
+# two are rewritten with export metadata, the rest copied when present.
+_DATA_EXPORTS = ("equations.json", "submissions.json", "core.json", "famous_equations.json")
+
+
+# Rendered registry cards are cached between builds, keyed on a hash of the
+# entry. The salt is derived from this file so template edits invalidate it.
+_CARD_CACHE_SALT = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+def _card_cache_path(repo_root: Path) -> Path:
+    return repo_root / ".cache" / "build_site" / "cards.json"
+
+
+def _card_key(kind: str, rank: int, entry: dict) -> str:
+    raw = json.dumps([kind, rank, entry], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_card_cache(repo_root: Path) -> dict[str, str]:
+    cache = _load_json_safe(_card_cache_path(repo_root), {})
+    if not isinstance(cache, dict) or cache.get("salt") != _CARD_CACHE_SALT:
+        return {}
+    cards = cache.get("cards", {})
+    return cards if isinstance(cards, dict) else {}
+
+
+def _save_card_cache(repo_root: Path, cards: dict[str, str]) -> None:
+    path = _card_cache_path(repo_root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"salt": _CARD_CACHE_SALT, "cards": cards}), encoding="utf-8")
+    except OSError:
+        # The cache is an optimization only; never fail the build over it.
+        pass
+
+
+# Canonical units/theory labels, keyed by their usual spellings, so cards can
+# skip the per-entry str().upper() for the handful of values seen in practice.
+_CANON_UPPER = {
+    spelling: label
+    for label in ("OK", "WARN", "ERROR", "TBD", "PASS", "FAIL", "PASS-WITH-ASSUMPTIONS", "")
+    for spelling in (label, label.lower())
+}
+
+
+def _upper(value: object) -> str:
+    if type(value) is str:
+        label = _CANON_UPPER.get(value)
+        if label is not None:
+            return label
+    return str(value).upper()
+
+
 def _badge(text: str, kind: str) -> str:
     return f"<span class='badge badge--{kind}'>{_esc(text)}</span>"
 
 
+_UNITS_CSS = {"OK": "good", "WARN": "warn", "ERROR": "bad"}
+
+
+# Units/theory take a handful of distinct values, so whole pills are memoized.
+@functools.lru_cache(maxsize=256)
 def _status_badge(val: str, kind: str) -> str:
-    v = (val or "").upper()
+    v = _upper(val or "")
     css = "neutral"
     if kind == "units":
-        css = {"OK": "good", "WARN": "warn", "ERROR": "bad"}.get(v, "neutral")
+        css = _UNITS_CSS.get(v, "neutral")
     if kind == "theory":
         if v == "PASS":
             css = "good"
@@ -74,6 +188,12 @@ def _artifact(val: dict | str | None) -> str:
         return _esc(val) if val.strip() else "planned"
     path = (val.get("path") or "").strip()
     status = (val.get("status") or "planned").strip() or "planned"
+    return _artifact_html(path, status)
+
+
+# Most cards share a few statuses ("planned", ...) and paths, so memoize.
+@functools.lru_cache(maxsize=1024)
+def _artifact_html(path: str, status: str) -> str:
     if path:
         return f"<a href='{_esc(path)}' target='_blank' rel='noopener'>link</a>"
     return _esc(status)
@@ -145,6 +265,85 @@ def _equation_classes(entry: dict) -> str:
   return ""
 
 
+_KATEX_WORKER_JS = r"""
+const katex = require('katex');
+const rl = require('readline').createInterface({input: process.stdin});
+rl.on('line', (line) => {
+  let html = null;
+  try {
+    html = katex.renderToString(JSON.parse(line), {displayMode: true, throwOnError: false});
+  } catch (err) {}
+  process.stdout.write(JSON.stringify(html) + '\n');
+});
+"""
+
+
+class _TexRenderer:
+    """Render display LaTeX to HTML at build time through one long-lived node process.
+
+    Needs `node` on PATH and the `katex` npm package resolvable from the repo
+    root (e.g. `npm install --no-save katex@0.16.11`). Any failure disables the
+    renderer and the affected equations fall back to client-side auto-render.
+    """
+
+    def __init__(self, cwd: Path) -> None:
+        self._cache: dict[str, str | None] = {}
+        # Number of render() calls that returned None (client-side fallback).
+        self.fallbacks = 0
+        self._proc: subprocess.Popen[str] | None = None
+        node = shutil.which("node")
+        if node is None:
+            return
+        try:
+            self._proc = subprocess.Popen(
+                [node, "-e", _KATEX_WORKER_JS],
+                cwd=str(cwd),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+            )
+        except OSError:
+            self._proc = None
+
+    def render(self, tex: str) -> str | None:
+        if tex in self._cache:
+            html_out = self._cache[tex]
+            if html_out is None:
+                self.fallbacks += 1
+            return html_out
+        html_out = None
+        if self._proc is not None:
+            try:
+                self._proc.stdin.write(json.dumps(tex) + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+                html_out = json.loads(line) if line else None
+                if not line:
+                    self.close()
+            except (OSError, ValueError):
+                self.close()
+        self._cache[tex] = html_out
+        if html_out is None:
+            self.fallbacks += 1
+        return html_out
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+
+# Set by main() when --prerender-math is given; None means client-side KaTeX.
+_tex_renderer: _TexRenderer | None = None
+
+
 def _equation_block(label: str, eq: str, eq_classes: str = "") -> str:
   """Render an equation card with header bar + copy button.
 
@@ -154,6 +353,8 @@ def _equation_block(label: str, eq: str, eq_classes: str = "") -> str:
   html.escape, which also escapes quotes (the html.escape default).
   """
   esc_eq = _esc(eq)
+  rendered = _tex_renderer.render(eq) if _tex_renderer is not None else None
+  tex_html = rendered if rendered is not None else f"$${esc_eq}$$"
   return (
     f"<div class='equation{eq_classes}' data-tex=\"{esc_eq}\">"
     f"<div class='equation__head'>"
@@ -164,11 +365,67 @@ def _equation_block(label: str, eq: str, eq_classes: str = "") -> str:
     f"<span class='equation__copy-text'>Copy</span>"
     f"</button>"
     f"</div>"
-    f"<div class='equation__tex'>$${esc_eq}$$</div>"
+    f"<div class='equation__tex'>{tex_html}</div>"
     f"</div>"
   )
 
 
+_REPO_CELL_EMPTY = "<span class='muted'>-</span>"
+
+
+def _repo_url(entry: dict) -> str:
+    return (entry.get("repoUrl") or "").strip()
+
+
+def _repo_cell(url: str) -> str:
+    """Link to an equation's GitHub repo, or a muted dash when it has none."""
+    if not url:
+        return _REPO_CELL_EMPTY
+    return f"<a href='{_esc(url)}' target='_blank' rel='noopener'>equation repo &rarr;</a>"
+
+
+_RE_URL_SCHEME = re.compile(r"^[a-z]+://", re.IGNORECASE)
+
+
+def _repo_artifact(obj: dict | str | None, repo_url: str) -> str | None:
+    if isinstance(obj, dict):
+        path = obj.get("path", "").strip()
+        if not path:
+            return _artifact(obj)
+        if _RE_URL_SCHEME.match(path):
+            return _artifact(obj)
+        if path.startswith("./assets/") or path.startswith("data/artifacts/"):
+            return _artifact(obj)
+        if repo_url:
+            fname = Path(path).name
+            url = f"{repo_url}/blob/main/images/{fname}"
+            return f"<a href='{_esc(url)}' target='_blank' rel='noopener'>link</a>"
+        return _artifact(obj)
+    return None
+
+
+def _as_list(value: object) -> list:
+    """Normalize a list-or-scalar field (e.g. assumptions) to a list in one step."""
+    if not value:
+        return []
+    if type(value) is list:
+        return value
+    return [str(value)]
+
+
+@functools.lru_cache(maxsize=512)
+def _ul(items: tuple[str, ...]) -> str:
+    """Render a bullet list; memoized because many entries share assumption lists."""
+    parts = ["<ul class='ul'>"]
+    for x in items:
+        if x.strip():
+            parts += ("<li>", _esc(x), "</li>")
+    if len(parts) == 1:
+        return ""
+    parts.append("</ul>")
+    return "".join(parts)
+
+
 def _card_equation(entry: dict, fallback_entry: dict | None = None) -> str:
   for candidate in (entry, fallback_entry or {}):
     display = candidate.get("display", {}) or {}
@@ -226,53 +483,46 @@ def _leaderboard_discovery_panel(entries: list[dict], limit: int = 10) -> str:
     )
 
 
-def _page(title: str, body: str, updated: str, extra_head: str = "") -> str:
-    # KaTeX for fast, crisp equation rendering.
-    katex_css = "https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.css"
-    katex_js = "https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.js"
-    autorender_js = "https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/contrib/auto-render.min.js"
+# Whitespace between tags is collapsed to a single newline: browsers render
+# that exactly like the original indentation, and docs/ diffs stay line-based.
+# <pre> and <script> blocks are passed through untouched.
+_RE_MINIFY = re.compile(
+    r"(<pre\b.*?</pre>|<script\b.*?</script>)|(?<=>)\s+(?=<)",
+    re.IGNORECASE | re.DOTALL,
+)
 
-    cachebust = re.sub(r"[^0-9]", "", updated) or "1"
 
-    og_desc = "Open registry for equations with normalized component scoring, published certificates, and machine-readable data exports."
-    og_url = "https://rdm3dc.github.io/TopEquations/"
+def _minify_html(page: str) -> str:
+    return _RE_MINIFY.sub(lambda m: m.group(1) or "\n", page)
 
-    return f"""<!doctype html>
+
+# Static page shell. Only the title, body, build stamp, cache-bust token and
+# extra <head> markup vary per page; the KaTeX CDN URLs and OpenGraph text
+# are baked in once at import.
+_PAGE_SRC = """<!doctype html>
 <html lang='en'>
 <head>
   <meta charset='utf-8' />
   <meta name='viewport' content='width=device-width, initial-scale=1' />
-  <title>{_esc(title)}</title>
+  <title>$title</title>
 
-  <meta name='description' content='{og_desc}' />
+  <meta name='description' content='Open registry for equations with normalized component scoring, published certificates, and machine-readable data exports.' />
   <meta property='og:type' content='website' />
-  <meta property='og:title' content='{_esc(title)}' />
-  <meta property='og:description' content='{og_desc}' />
-  <meta property='og:url' content='{og_url}' />
+  <meta property='og:title' content='$title' />
+  <meta property='og:description' content='Open registry for equations with normalized component scoring, published certificates, and machine-readable data exports.' />
+  <meta property='og:url' content='https://rdm3dc.github.io/TopEquations/' />
   <meta name='twitter:card' content='summary' />
-  <meta name='twitter:title' content='{_esc(title)}' />
-  <meta name='twitter:description' content='{og_desc}' />
-
-  <link rel='stylesheet' href='./assets/style.css?v={cachebust}' />
-  <link rel='stylesheet' href='{katex_css}' />
-  {extra_head}
-
-  <script defer src='./assets/app.js?v={cachebust}'></script>
-  <script defer src='{katex_js}'></script>
-  <script defer src='{autorender_js}'></script>
-  <script defer>
-    window.addEventListener('DOMContentLoaded', () => {{
-      if (window.renderMathInElement) {{
-        window.renderMathInElement(document.body, {{
-          delimiters: [
-            {{left: '$$', right: '$$', display: true}},
-            {{left: '$', right: '$', display: false}},
-          ],
-          throwOnError: false,
-        }});
-      }}
-    }});
-  </script>
+  <meta name='twitter:title' content='$title' />
+  <meta name='twitter:description' content='Open registry for equations with normalized component scoring, published certificates, and machine-readable data exports.' />
+
+  <link rel='stylesheet' href='./assets/style.css?v=$cachebust' />
+  <link rel='stylesheet' href='https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.css' />
+  $extra_head
+
+  <script defer src='./assets/app.js?v=$cachebust'></script>
+  <script defer src='https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.js'></script>
+  <script defer src='https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/contrib/auto-render.min.js'></script>
+  <script defer src='./assets/katex-init.js?v=$cachebust'></script>
 </head>
 <body>
   <header class='topbar'>
@@ -298,13 +548,13 @@ def _page(title: str, body: str, updated: str, extra_head: str = "") -> str:
   </header>
 
   <main class='wrap'>
-    {body}
+    $body
     <footer class='footer'>
-      <div>Last built: <strong>{_esc(updated)}</strong></div>
+      <div>Last built: <strong>$updated</strong></div>
       <div style='margin-top:.5rem'>
-        <a href='https://cash.app/$rdm3d' target='_blank' rel='noopener'
+        <a href='https://cash.app/$$rdm3d' target='_blank' rel='noopener'
            style='color:#00d632;font-weight:600;text-decoration:none'>
-          &#x1F4B2; Support via Cash App — $rdm3d
+          &#x1F4B2; Support via Cash App — $$rdm3d
         </a>
       </div>
     </footer>
@@ -312,6 +562,79 @@ def _page(title: str, body: str, updated: str, extra_head: str = "") -> str:
 </body>
 </html>
 """
+_PAGE_HEAD_TPL, _PAGE_TAIL_TPL = (string.Template(part) for part in _PAGE_SRC.split("$body"))
+
+
+def _page_shell(title: str, updated: str, extra_head: str = "") -> tuple[str, str]:
+    """Return the page markup before and after the body slot."""
+    cachebust = "".join(ch for ch in updated if ch in _ASCII_DIGITS) or "1"
+    head = _PAGE_HEAD_TPL.substitute(title=_esc(title), cachebust=cachebust, extra_head=extra_head)
+    tail = _PAGE_TAIL_TPL.substitute(updated=_esc(updated))
+    return head, tail
+
+
+def _page(title: str, body: str, updated: str, extra_head: str = "") -> str:
+    head, tail = _page_shell(title, updated, extra_head)
+    return _minify_html(head + body + tail)
+
+
+_RE_TRAILING_TAG_WS = re.compile(r">\s*\Z")
+
+
+class _MinifyingWriter:
+    """Minify HTML fragments as they are written to an open text file.
+
+    A trailing '>' plus whitespace is held back until the next fragment so
+    whitespace between tags is collapsed exactly as _minify_html would do on
+    the joined page. Fragments must not split a <pre> or <script> block.
+    """
+
+    def __init__(self, fh) -> None:
+        self._fh = fh
+        self._held = ""
+
+    def write(self, fragment: str) -> None:
+        text = self._held + fragment
+        m = _RE_TRAILING_TAG_WS.search(text)
+        if m:
+            self._held = text[m.start():]
+            text = text[:m.start()]
+        else:
+            self._held = ""
+        self._fh.write(_minify_html(text))
+
+    def close(self) -> None:
+        self._fh.write(_minify_html(self._held))
+        self._held = ""
+
+
+def _write_html(out: Path, page: str) -> None:
+    # One encode and one write; no text-layer buffering or newline translation.
+    out.write_bytes(page.encode("utf-8"))
+
+
+def _write_page(
+    outs: list[Path],
+    title: str,
+    fragments: Iterable[str],
+    updated: str,
+    extra_head: str = "",
+) -> None:
+    """Stream a page to disk fragment by fragment instead of joining it in memory.
+
+    The first path is written; any further paths receive a byte copy.
+    """
+    head, tail = _page_shell(title, updated, extra_head)
+    # newline="\n" keeps the bytes identical to _write_html's on every platform.
+    with outs[0].open("w", encoding="utf-8", newline="\n", buffering=1 << 16) as fh:
+        writer = _MinifyingWriter(fh)
+        writer.write(head)
+        for fragment in fragments:
+            writer.write(fragment)
+        writer.write(tail)
+        writer.close()
+    for out in outs[1:]:
+        shutil.copyfile(outs[0], out)
 
 
 def _build_core_cards(repo_root: Path) -> list[str]:
@@ -324,21 +647,15 @@ def _build_core_cards(repo_root: Path) -> list[str]:
     core_cards: list[str] = []
     for e in core_entries:
         name = e.get("name", "")
-        eq = e.get("equationLatex", "") or "(pending)"
         eq = _card_equation(e)
         eq_classes = _equation_classes(e)
         desc = e.get("description", "")
         src = e.get("source", "")
         url = e.get("sourceUrl", "")
-        repo_url = e.get("repoUrl", "")
-        repo_link = (
-            f"<a href='{_esc(repo_url)}' target='_blank' rel='noopener'>equation repo &rarr;</a>"
-            if repo_url
-            else "<span class='muted'>-</span>"
-        )
+        repo_link = _repo_cell(_repo_url(e))
         total_score, rb = _rubric_score(e)
-        units = str(e.get("units", "WARN")).upper()
-        theory = str(e.get("theory", "PASS-WITH-ASSUMPTIONS")).upper()
+        units = _upper(e.get("units", "WARN"))
+        theory = _upper(e.get("theory", "PASS-WITH-ASSUMPTIONS"))
         anim = _artifact(e.get("animation"))
         img = _artifact(e.get("image"))
         core_cards.append(
@@ -349,7 +666,7 @@ def _build_core_cards(repo_root: Path) -> list[str]:
     <div class='card__head'>
       <h2 class='card__title'>{_esc(name)}</h2>
       <div class='card__meta'>
-        <span class='badge badge--score'>{_esc(f'Score {total_score}')}</span>
+        <span class='badge badge--score'>Score {total_score}</span>
         <span class='pill pill--neutral'>Pinned</span>
         <span class='pill pill--{'good' if units == 'OK' else 'warn'}'>{_esc(units)}</span>
         <span class='pill pill--{'good' if theory == 'PASS' else ('bad' if theory == 'FAIL' else 'warn')}'>{_esc(theory)}</span>
@@ -375,14 +692,19 @@ def _build_core_cards(repo_root: Path) -> list[str]:
     return core_cards
 
 
-def _rubric_score(e: dict) -> tuple[int, dict[str, int]]:
-    def _clamp(v: object, lo: int, hi: int) -> int:
-        try:
-            n = int(float(v))
-        except Exception:
-            n = lo
-        return max(lo, min(hi, n))
+def _clamp(v: object, lo: int, hi: int) -> int:
+    try:
+        n = int(float(v))
+    except Exception:
+        n = lo
+    return max(lo, min(hi, n))
+
 
+# Normalized totals for every possible 0-70 raw rubric sum.
+_RUBRIC_TOTALS = tuple(int(round((raw / 70.0) * 100.0)) for raw in range(71))
+
+
+def _rubric_score(e: dict) -> tuple[int, dict[str, int]]:
     tractability = _clamp(e.get("tractability", 0), 0, 20)
     plausibility = _clamp(e.get("plausibility", 0), 0, 20)
     validation = _clamp(e.get("validation", 0), 0, 20)
@@ -391,29 +713,31 @@ def _rubric_score(e: dict) -> tuple[int, dict[str, int]]:
     novelty_info = ((e.get("tags", {}) or {}).get("novelty", {}) or {})
     novelty_tag = "-"
     if novelty_info:
-      novelty_tag = f"{novelty_info.get('score', '-')} @ {novelty_info.get('date', '-')}"
-
-    units = str(e.get("units", "")).upper()
-    theory = str(e.get("theory", "")).upper()
-    animation = str(e.get("animation", "planned")).strip().lower()
-    image = str(e.get("image", "planned")).strip().lower()
+        novelty_tag = f"{novelty_info.get('score', '-')} @ {novelty_info.get('date', '-')}"
 
     # Rubric v2: novelty is metadata tag only; not part of ranking total.
-    total_raw = tractability + plausibility + validation + artifact
-    total = int(round((total_raw / 70.0) * 100.0))
-    return total, {
-      "novelty_tag": novelty_tag,
+    return _RUBRIC_TOTALS[tractability + plausibility + validation + artifact], {
+        "novelty_tag": novelty_tag,
         "tractability": tractability,
         "plausibility": plausibility,
-      "validation": validation,
-      "artifact": artifact,
+        "validation": validation,
+        "artifact": artifact,
     }
 
 
-def build_core(repo_root: Path, docs: Path) -> None:
-    core_cards = _build_core_cards(repo_root)
+_RUBRIC_PANEL_HTML = """<div class='panel'>
+  <h2>Scoring Rubric (0-100)</h2>
+  <ul>
+    <li>Tractability (0-20)</li>
+    <li>Physical plausibility (0-20)</li>
+    <li>Validation (0-20)</li>
+    <li>Artifact completeness (0-10)</li>
+    <li>Total normalized from a 70-point base</li>
+    <li>Novelty is shown as a dated tag only</li>
+  </ul>
+</div>"""
 
-    body = """
+_CORE_BODY_HEAD = """
 <div class='layout layout--single'>
   <section class='maincol'>
 
@@ -424,123 +748,88 @@ def build_core(repo_root: Path, docs: Path) -> None:
   </div>
 </div>
 
-<div class='panel'>
-  <h2>Scoring Rubric (0-100)</h2>
-  <ul>
-    <li>Tractability (0-20)</li>
-    <li>Physical plausibility (0-20)</li>
-    <li>Validation (0-20)</li>
-    <li>Artifact completeness (0-10)</li>
-    <li>Total normalized from a 70-point base</li>
-    <li>Novelty is shown as a dated tag only</li>
-  </ul>
-</div>
+""" + _RUBRIC_PANEL_HTML + """
 
 <div id='coreCards' class='cardrow'>
-""" + "\n".join(core_cards) + """
+"""
+
+_CORE_BODY_TAIL = """
 </div>
 
   </section>
 </div>
 """
 
-    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
-    out = docs / "core.html"
-    out.write_text(_page("TopEquations — Canonical Core", body, updated), encoding="utf-8")
-
-
-def build_leaderboard(repo_root: Path, docs: Path) -> None:
-  # Ranked derived equations only (display capped to score >= 65).
-    DISPLAY_THRESHOLD = 65
 
-    data_path = repo_root / "data" / "equations.json"
-    data = json.loads(data_path.read_text(encoding="utf-8"))
-    entries_all = list(data.get("entries", []))
-    entries_all.sort(key=lambda e: float(e.get("score", 0)), reverse=True)
-
-    entries = [e for e in entries_all if float(e.get("score", 0)) >= DISPLAY_THRESHOLD]
-    export_entries = [_entry_with_export_metadata(entry) for entry in entries]
-
-    data_dir = docs / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    registry_payload = json.dumps(
-      {
-        "schemaVersion": 1,
-        "generatedAt": datetime.now().isoformat(),
-        "displayThreshold": DISPLAY_THRESHOLD,
-        "entries": export_entries,
-      },
-      indent=2,
-    ) + "\n"
-    for export_name in ("registry.json", "leaderboard.json"):
-      (data_dir / export_name).write_text(registry_payload, encoding="utf-8")
-
-    cards = []
-    for i, e in enumerate(entries, start=1):
-        eq = _card_equation(e)
-        name = e.get("name", "")
-        has_latex = "1" if eq.strip() and eq != "(pending)" else "0"
-        eq_classes = _equation_classes(e)
-        src = e.get("source", "")
-        desc = e.get("description", "")
-        score = e.get("score", "")
-        units = e.get("units", "")
-        theory = e.get("theory", "")
-        date = e.get("date", "")
-        eq_id = (e.get("id") or "").strip()
-        repo_url = (e.get("repoUrl") or "").strip()
-        highlight_tier = _highlight_label(e)
-        highlight_badge = _highlight_badge(e)
-
-        # Point animation/image links to the equation repo when available
-        def _repo_artifact(obj, repo_url):
-          if isinstance(obj, dict):
-            path = obj.get("path", "").strip()
-            if not path:
-              return _artifact(obj)
-            if re.match(r"^[a-z]+://", path, re.IGNORECASE):
-              return _artifact(obj)
-            if path.startswith("./assets/") or path.startswith("data/artifacts/"):
-              return _artifact(obj)
-            if repo_url:
-              fname = Path(path).name
-              url = f"{repo_url}/blob/main/images/{fname}"
-              return f"<a href='{_esc(url)}' target='_blank' rel='noopener'>link</a>"
-            return _artifact(obj)
-
-        anim = _repo_artifact(e.get("animation"), repo_url)
-        img = _repo_artifact(e.get("image"), repo_url)
-
-        has_latex = "1" if (e.get("equationLatex") or "").strip() else "0"
-        # Optional educational metadata
-        differential = (e.get("differentialLatex") or "").strip()
-        derivation = (e.get("derivation") or "").strip()
-        assumptions = e.get("assumptions") or []
-        if not isinstance(assumptions, list):
-            assumptions = [str(assumptions)]
-
-        def _ul(items: list[str]) -> str:
-            if not items:
-                return ""
-            lis = "".join(f"<li>{_esc(x)}</li>" for x in items if str(x).strip())
-            return f"<ul class='ul'>{lis}</ul>" if lis else ""
-
-        extra = ""
-        if differential:
-          extra += f"<div class='kv'><div class='k'>Differential form</div><div class='v'>$${_esc(differential)}$$</div></div>"
-        if derivation:
-            extra += f"<div class='kv'><div class='k'>Derivation bridge</div><div class='v'>{_esc(derivation)}</div></div>"
-        if assumptions:
-            extra += f"<div class='kv'><div class='k'>Assumptions</div><div class='v'>{_ul([str(x) for x in assumptions])}</div></div>"
-        if eq_id:
-          extra += f"<div class='kv'><div class='k'>Certificate</div><div class='v'><a href='./certificates.html#{_esc(eq_id)}'>view on chain record</a></div></div>"
+def build_core(repo_root: Path, docs: Path, updated: str | None = None) -> None:
+    core_cards = _build_core_cards(repo_root)
+    body = "".join((_CORE_BODY_HEAD, "\n".join(core_cards), _CORE_BODY_TAIL))
 
-        if repo_url:
-          extra += f"<div class='kv'><div class='k'>Repository</div><div class='v'><a href='{_esc(repo_url)}' target='_blank' rel='noopener'>equation repo &rarr;</a></div></div>"
+    updated = updated or _build_stamp()
+    out = docs / "core.html"
+    _write_html(out, _page("TopEquations — Canonical Core", body, updated))
+
+
+# Fields read for every registry card, with the defaults the card expects.
+# One merge + itemgetter call replaces a chain of per-key dict.get lookups.
+_LEADERBOARD_DEFAULTS: dict[str, object] = {
+    "name": "",
+    "source": "",
+    "description": "",
+    "score": "",
+    "units": "",
+    "theory": "",
+    "date": "",
+    "id": None,
+    "repoUrl": None,
+    "animation": None,
+    "image": None,
+    "equationLatex": None,
+    "differentialLatex": None,
+    "derivation": None,
+    "assumptions": None,
+}
+_LEADERBOARD_FIELDS = itemgetter(*_LEADERBOARD_DEFAULTS)
+
+
+def _render_leaderboard_card(i: int, e: dict) -> str:
+    (
+        name, src, desc, score, units, theory, date, eq_id, repo_url,
+        anim_val, img_val, eq_raw, differential, derivation, assumptions,
+    ) = _LEADERBOARD_FIELDS(_LEADERBOARD_DEFAULTS | e)
+    eq = _card_equation(e)
+    eq_classes = _equation_classes(e)
+    eq_id = (eq_id or "").strip()
+    repo_url = (repo_url or "").strip()
+    highlight_tier = _highlight_label(e)
+    highlight_badge = _highlight_badge(e)
+
+    # Point animation/image links to the equation repo when available
+    anim = _repo_artifact(anim_val, repo_url)
+    img = _repo_artifact(img_val, repo_url)
+
+    has_latex = "1" if (eq_raw or "").strip() else "0"
+    # Optional educational metadata
+    differential = (differential or "").strip()
+    derivation = (derivation or "").strip()
+    assumptions = _as_list(assumptions)
+
+    esc_date = _esc(date)
+    extra: list[str] = []
+    if differential:
+        extra.append(f"<div class='kv'><div class='k'>Differential form</div><div class='v'>$${_esc(differential)}$$</div></div>")
+    if derivation:
+        extra.append(f"<div class='kv'><div class='k'>Derivation bridge</div><div class='v'>{_esc(derivation)}</div></div>")
+    if assumptions:
+        extra.append(f"<div class='kv'><div class='k'>Assumptions</div><div class='v'>{_ul(tuple(str(x) for x in assumptions))}</div></div>")
+    if eq_id:
+        extra.append(f"<div class='kv'><div class='k'>Certificate</div><div class='v'><a href='./certificates.html#{_esc(eq_id)}'>view on chain record</a></div></div>")
+    if repo_url:
+        extra.append(f"<div class='kv'><div class='k'>Repository</div><div class='v'>{_repo_cell(repo_url)}</div></div>")
 
-        cards.append(
-          f"""
-    <section class='card' data-rank='{i}' data-score='{_esc(score)}' data-date='{_esc(date)}' data-haslatex='{has_latex}'>
+    return (
+        f"""
+    <section class='card' data-rank='{i}' data-score='{_esc(score)}' data-date='{esc_date}' data-haslatex='{has_latex}'>
   <div class='card__rank'>#{i}</div>
   <div class='card__body'>
     <div class='card__head'>
@@ -559,23 +848,24 @@ def build_leaderboard(repo_root: Path, docs: Path) -> None:
 
     <div class='grid'>
       <div class='kv'><div class='k'>Description</div><div class='v'>{_esc(desc)}</div></div>
-      {extra}
+      {''.join(extra)}
       <div class='kv'><div class='k'>Highlight</div><div class='v'>{_esc(highlight_tier)}</div></div>
-      <div class='kv'><div class='k'>Date</div><div class='v'>{_esc(date)}</div></div>
+      <div class='kv'><div class='k'>Date</div><div class='v'>{esc_date}</div></div>
       <div class='kv'><div class='k'>Animation</div><div class='v'>{anim}</div></div>
       <div class='kv'><div class='k'>Image/Diagram</div><div class='v'>{img}</div></div>
     </div>
   </div>
 </section>
 """
-        )
+    )
+
 
-    extra_head = """
+_LB_EXTRA_HEAD = """
   <link rel='alternate' type='application/json' href='./data/registry.json' title='TopEquations registry JSON' />
   <link rel='alternate' type='application/json' href='./data/equations.json' title='TopEquations equations JSON' />
 """
 
-    body = """
+_LB_BODY_PRE = """
 <div class='layout layout--single'>
   <section class='maincol'>
 
@@ -619,31 +909,90 @@ def build_leaderboard(repo_root: Path, docs: Path) -> None:
 </div>
 
 <div id='cards' class='cardrow'>
-""" + "\n".join(cards) + """
-</div>
+"""
 
-""" + _leaderboard_discovery_panel(entries) + """ 
+_LB_BODY_POST = " \n\n  </section>\n</div>\n"
+
+_CARDROW_CLOSE = "\n</div>\n\n  </section>\n</div>\n"
 
-  </section>
-</div>
-"""
 
-    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
-    page_html = _page("TopEquations — Registry", body, updated, extra_head=extra_head)
-    for output_name in ("registry.html", "leaderboard.html"):
-      (docs / output_name).write_text(page_html, encoding="utf-8")
+def _desc_order(keys: list) -> list[int]:
+    """Indices ordering ``keys`` highest first; stable, and key lookup stays in C."""
+    return sorted(range(len(keys)), key=keys.__getitem__, reverse=True)
 
 
-def build_rising(repo_root: Path, docs: Path) -> None:
+def build_leaderboard(repo_root: Path, docs: Path, updated: str | None = None) -> None:
+  # Ranked derived equations only (display capped to score >= 65).
+    DISPLAY_THRESHOLD = 65
+
+    data_path = repo_root / "data" / "equations.json"
+    data = _load_json(data_path)
+    entries_all = data.get("entries", [])
+    scores = [float(e.get("score", 0)) for e in entries_all]
+
+    entries = [entries_all[i] for i in _desc_order(scores) if scores[i] >= DISPLAY_THRESHOLD]
+    export_entries = [_entry_with_export_metadata(entry) for entry in entries]
+
+    data_dir = docs / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    registry_payload = json.dumps(
+      {
+        "schemaVersion": 1,
+        "generatedAt": _build_started.isoformat(),
+        "displayThreshold": DISPLAY_THRESHOLD,
+        "entries": export_entries,
+      },
+      indent=2,
+    ) + "\n"
+    for export_name in ("registry.json", "leaderboard.json"):
+      (data_dir / export_name).write_text(registry_payload, encoding="utf-8")
+
+    card_cache = _load_card_cache(repo_root)
+    fresh_cache: dict[str, str] = {}
+    cards = []
+    for i, e in enumerate(entries, start=1):
+        key = _card_key("registry+tex" if _tex_renderer is not None else "registry", i, e)
+        card = card_cache.get(key)
+        if card is None:
+            fallbacks = _tex_renderer.fallbacks if _tex_renderer is not None else 0
+            card = _render_leaderboard_card(i, e)
+            if _tex_renderer is not None and _tex_renderer.fallbacks != fallbacks:
+                # Some equation fell back to raw $$..$$; don't store that under
+                # the prerendered key, or a later build with KaTeX would reuse it.
+                cards.append(card)
+                continue
+        fresh_cache[key] = card
+        cards.append(card)
+    _save_card_cache(repo_root, fresh_cache)
+
+    fragments = [
+        _LB_BODY_PRE,
+        "\n".join(cards),
+        "\n</div>\n\n",
+        _leaderboard_discovery_panel(entries),
+        _LB_BODY_POST,
+    ]
+
+    updated = updated or _build_stamp()
+    _write_page(
+        [docs / "registry.html", docs / "leaderboard.html"],
+        "TopEquations — Registry",
+        fragments,
+        updated,
+        extra_head=_LB_EXTRA_HEAD,
+    )
+
+
+def build_rising(repo_root: Path, docs: Path, updated: str | None = None) -> None:
     """Equations below the registry threshold — still in development."""
     DISPLAY_THRESHOLD = 65
 
     data_path = repo_root / "data" / "equations.json"
-    data = json.loads(data_path.read_text(encoding="utf-8"))
-    entries_all = list(data.get("entries", []))
-    entries_all.sort(key=lambda e: float(e.get("score", 0)), reverse=True)
+    data = _load_json(data_path)
+    entries_all = data.get("entries", [])
+    scores = [float(e.get("score", 0)) for e in entries_all]
 
-    entries = [e for e in entries_all if float(e.get("score", 0)) < DISPLAY_THRESHOLD]
+    entries = [entries_all[i] for i in _desc_order(scores) if scores[i] < DISPLAY_THRESHOLD]
 
     cards = []
     for i, e in enumerate(entries, start=1):
@@ -657,20 +1006,12 @@ def build_rising(repo_root: Path, docs: Path) -> None:
         theory = e.get("theory", "")
         date = e.get("date", "")
         eq_id = (e.get("id") or "").strip()
-        repo_url = (e.get("repoUrl") or "").strip()
+        repo_url = _repo_url(e)
 
         anim = _artifact(e.get("animation"))
         img = _artifact(e.get("image"))
 
-        assumptions = e.get("assumptions") or []
-        if not isinstance(assumptions, list):
-            assumptions = [str(assumptions)]
-
-        def _ul(items: list[str]) -> str:
-            if not items:
-                return ""
-            lis = "".join(f"<li>{_esc(x)}</li>" for x in items if str(x).strip())
-            return f"<ul class='ul'>{lis}</ul>" if lis else ""
+        assumptions = _as_list(e.get("assumptions"))
 
         extra = ""
         differential = (e.get("differentialLatex") or "").strip()
@@ -680,11 +1021,11 @@ def build_rising(repo_root: Path, docs: Path) -> None:
         if derivation:
             extra += f"<div class='kv'><div class='k'>Derivation bridge</div><div class='v'>{_esc(derivation)}</div></div>"
         if assumptions:
-            extra += f"<div class='kv'><div class='k'>Assumptions</div><div class='v'>{_ul([str(x) for x in assumptions])}</div></div>"
+            extra += f"<div class='kv'><div class='k'>Assumptions</div><div class='v'>{_ul(tuple(str(x) for x in assumptions))}</div></div>"
         if eq_id:
             extra += f"<div class='kv'><div class='k'>Certificate</div><div class='v'><a href='./certificates.html#{_esc(eq_id)}'>view on chain record</a></div></div>"
         if repo_url:
-            extra += f"<div class='kv'><div class='k'>Repository</div><div class='v'><a href='{_esc(repo_url)}' target='_blank' rel='noopener'>equation repo &rarr;</a></div></div>"
+            extra += f"<div class='kv'><div class='k'>Repository</div><div class='v'>{_repo_cell(repo_url)}</div></div>"
 
         cards.append(
             f"""
@@ -729,7 +1070,7 @@ def build_rising(repo_root: Path, docs: Path) -> None:
   <div class='hero__right'>
     <div class='statbox'>
       <div class='stat'>
-        <div class='stat__num'>{_esc(count)}</div>
+        <div class='stat__num'>{count}</div>
         <div class='stat__label'>Rising equations</div>
       </div>
     </div>
@@ -737,18 +1078,25 @@ def build_rising(repo_root: Path, docs: Path) -> None:
 </div>
 
 <div id='cards' class='cardrow'>
-""" + "\n".join(cards) + """
-</div>
-
-  </section>
-</div>
 """
+    fragments = [body, "\n".join(cards), _CARDROW_CLOSE]
 
-    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
-    (docs / "rising.html").write_text(_page("TopEquations \u2014 Rising Equations", body, updated), encoding="utf-8")
+    updated = updated or _build_stamp()
+    _write_page([docs / "rising.html"], "TopEquations \u2014 Rising Equations", fragments, updated)
 
 
-def build_index(repo_root: Path, docs: Path) -> None:
+def _status_counts(entries: list[dict]) -> Counter[str]:
+    """Count submissions per lower-cased status in a single pass."""
+    counts: Counter[str] = Counter()
+    for e in entries:
+        status = e.get("status", "")
+        if type(status) is not str or not status.islower():
+            status = str(status).lower()
+        counts[status] += 1
+    return counts
+
+
+def build_index(repo_root: Path, docs: Path, updated: str | None = None) -> None:
     data = _load_json_safe(repo_root / "data" / "equations.json", {"entries": []})
     n = len(data.get("entries", []))
 
@@ -756,8 +1104,9 @@ def build_index(repo_root: Path, docs: Path) -> None:
     core_n = len(core.get("entries", []))
 
     subs = _load_json_safe(repo_root / "data" / "submissions.json", {"entries": []})
-    subs_n = len(subs.get("entries", []))
-    promoted_n = sum(1 for e in subs.get("entries", []) if str(e.get("status", "")).lower() == "promoted")
+    sub_entries = subs.get("entries", [])
+    subs_n = len(sub_entries)
+    promoted_n = _status_counts(sub_entries)["promoted"]
 
     body = f"""
 <div class='hero hero--home'>
@@ -776,19 +1125,19 @@ def build_index(repo_root: Path, docs: Path) -> None:
   <div class='hero__right'>
     <div class='statbox'>
       <div class='stat'>
-        <div class='stat__num'>{_esc(core_n)}</div>
+        <div class='stat__num'>{core_n}</div>
         <div class='stat__label'>Canonical core anchors</div>
       </div>
       <div class='stat'>
-        <div class='stat__num'>{_esc(n)}</div>
+        <div class='stat__num'>{n}</div>
         <div class='stat__label'>Ranked derived equations</div>
       </div>
       <div class='stat'>
-        <div class='stat__num'>{_esc(subs_n)}</div>
+        <div class='stat__num'>{subs_n}</div>
         <div class='stat__label'>Total submissions</div>
       </div>
       <div class='stat'>
-        <div class='stat__num'>{_esc(promoted_n)}</div>
+        <div class='stat__num'>{promoted_n}</div>
         <div class='stat__label'>Promoted to registry</div>
       </div>
     </div>
@@ -892,11 +1241,11 @@ def build_index(repo_root: Path, docs: Path) -> None:
 </div>
 """
 
-    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
-    (docs / "index.html").write_text(_page("TopEquations", body, updated), encoding="utf-8")
+    updated = updated or _build_stamp()
+    _write_html(docs / "index.html", _page("TopEquations", body, updated))
 
 
-def build_harvest(repo_root: Path, docs: Path) -> None:
+def build_harvest(repo_root: Path, docs: Path, updated: str | None = None) -> None:
     # Keep source harvest data private to repo; do not publish in docs/data.
     body = """
 <div class='hero'>
@@ -911,11 +1260,19 @@ def build_harvest(repo_root: Path, docs: Path) -> None:
 </div>
 """
 
-    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
-    (docs / "harvest.html").write_text(_page("TopEquations — Harvest", body, updated), encoding="utf-8")
+    updated = updated or _build_stamp()
+    _write_html(docs / "harvest.html", _page("TopEquations — Harvest", body, updated))
+
+
+_STATUS_PILLS = {
+    "promoted": "<span class='pill pill--good'>PROMOTED</span>",
+    "ready": "<span class='pill pill--warn'>READY</span>",
+    "duplicate": "<span class='pill pill--neutral'>DUPLICATE</span>",
+}
+_STATUS_PILL_DEFAULT = "<span class='pill pill--neutral'>NEEDS REVIEW</span>"
 
 
-def build_submissions(repo_root: Path, docs: Path) -> None:
+def build_submissions(repo_root: Path, docs: Path, updated: str | None = None) -> None:
     src = repo_root / "data" / "submissions.json"
     data = _load_json_safe(src, {"entries": []})
     equations = _load_json_safe(repo_root / "data" / "equations.json", {"entries": []})
@@ -925,14 +1282,16 @@ def build_submissions(repo_root: Path, docs: Path) -> None:
         if str(entry.get("id", "")).strip()
     }
 
-    entries = list(data.get("entries", []))
+    entries = data.get("entries", [])
     # Sort by submission date (newest first); scores belong on the leaderboard page
-    entries.sort(key=lambda x: x.get("submittedAt", ""), reverse=True)
+    submitted = [e.get("submittedAt", "") for e in entries]
+    entries = [entries[i] for i in _desc_order(submitted)]
 
     total = len(entries)
-    promoted = sum(1 for e in entries if str(e.get("status", "")).lower() == "promoted")
-    ready = sum(1 for e in entries if str(e.get("status", "")).lower() == "ready")
-    review = sum(1 for e in entries if str(e.get("status", "")).lower() == "needs-review")
+    status_counts = _status_counts(entries)
+    promoted = status_counts["promoted"]
+    ready = status_counts["ready"]
+    review = status_counts["needs-review"]
 
     cards: list[str] = []
     for idx, e in enumerate(entries, start=1):
@@ -943,8 +1302,8 @@ def build_submissions(repo_root: Path, docs: Path) -> None:
         source = e.get("source", "")
         submitter = e.get("submitter", "")
         date = e.get("submittedAt", "")
-        units = str(e.get("units", "TBD")).upper()
-        theory = str(e.get("theory", "")).upper()
+        units = _upper(e.get("units", "TBD"))
+        theory = _upper(e.get("theory", ""))
 
         review_data = e.get("review", {}) or {}
         eq_id = str(review_data.get("equationId", "")).strip()
@@ -954,35 +1313,28 @@ def build_submissions(repo_root: Path, docs: Path) -> None:
         eq = _card_equation(e, highlight_entry)
         eq_classes = _equation_classes(highlight_entry)
 
-        assumptions = e.get("assumptions", []) or []
-        if not isinstance(assumptions, list):
-            assumptions = [str(assumptions)]
-        assumptions_html = "".join(f"<li>{_esc(a)}</li>" for a in assumptions if str(a).strip())
+        assumptions = _as_list(e.get("assumptions"))
+        assumptions_ul = _ul(tuple(str(a) for a in assumptions)) if assumptions else ""
 
         evidence = e.get("evidence", []) or []
         evidence_html = ""
         if evidence:
-            ev_items = "".join(f"<li>{_esc(ev.get('label', '') if isinstance(ev, dict) else str(ev))}</li>" for ev in evidence)
-            evidence_html = f"<div class='kv'><div class='k'>Evidence</div><div class='v'><ul class='ul'>{ev_items}</ul></div></div>"
+            ev_parts = ["<div class='kv'><div class='k'>Evidence</div><div class='v'><ul class='ul'>"]
+            for ev in evidence:
+                ev_parts += ("<li>", _esc(ev.get("label", "") if isinstance(ev, dict) else str(ev)), "</li>")
+            ev_parts.append("</ul></div></div>")
+            evidence_html = "".join(ev_parts)
 
         anim = _artifact(e.get("animation"))
         img = _artifact(e.get("image"))
 
-        # Status badge styling
-        if status == "promoted":
-            status_pill = "<span class='pill pill--good'>PROMOTED</span>"
-        elif status == "ready":
-            status_pill = "<span class='pill pill--warn'>READY</span>"
-        elif status == "duplicate":
-            status_pill = "<span class='pill pill--neutral'>DUPLICATE</span>"
-        else:
-            status_pill = "<span class='pill pill--neutral'>NEEDS REVIEW</span>"
+        status_pill = _STATUS_PILLS.get(status, _STATUS_PILL_DEFAULT)
 
         chain_link = ""
-        if eq_id and status == "promoted":
-            chain_link = f"<div class='kv'><div class='k'>Chain record</div><div class='v'><a href='./certificates.html#{_esc(eq_id)}'>{_esc(eq_id)}</a></div></div>"
-        elif eq_id and status == "duplicate":
-          chain_link = f"<div class='kv'><div class='k'>Canonical equation</div><div class='v'><a href='./certificates.html#{_esc(eq_id)}'>{_esc(eq_id)}</a></div></div>"
+        if eq_id and status in ("promoted", "duplicate"):
+            esc_id = _esc(eq_id)
+            label = "Chain record" if status == "promoted" else "Canonical equation"
+            chain_link = f"<div class='kv'><div class='k'>{label}</div><div class='v'><a href='./certificates.html#{esc_id}'>{esc_id}</a></div></div>"
 
         cards.append(
             f"""
@@ -994,8 +1346,8 @@ def build_submissions(repo_root: Path, docs: Path) -> None:
       <div class='card__meta'>
         {status_pill}
         {highlight_badge}
-        {_status_badge(str(units), 'units')}
-        {_status_badge(str(theory), 'theory')}
+        {_status_badge(units, 'units')}
+        {_status_badge(theory, 'theory')}
       </div>
     </div>
 
@@ -1005,7 +1357,7 @@ def build_submissions(repo_root: Path, docs: Path) -> None:
 
     <div class='grid'>
       <div class='kv'><div class='k'>Description</div><div class='v'>{_esc(desc)}</div></div>
-      <div class='kv'><div class='k'>Assumptions</div><div class='v'>{("<ul class='ul'>" + assumptions_html + "</ul>") if assumptions_html else "None listed."}</div></div>
+      <div class='kv'><div class='k'>Assumptions</div><div class='v'>{assumptions_ul or "None listed."}</div></div>
       {evidence_html}
       <div class='kv'><div class='k'>Highlight</div><div class='v'>{_esc(highlight_tier)}</div></div>
       <div class='kv'><div class='k'>Submitted</div><div class='v'>{_esc(date)}</div></div>
@@ -1030,19 +1382,19 @@ def build_submissions(repo_root: Path, docs: Path) -> None:
   <div class='hero__right'>
     <div class='statbox'>
       <div class='stat'>
-        <div class='stat__num'>{_esc(total)}</div>
+        <div class='stat__num'>{total}</div>
         <div class='stat__label'>Total submissions</div>
       </div>
       <div class='stat'>
-        <div class='stat__num'>{_esc(promoted)}</div>
+        <div class='stat__num'>{promoted}</div>
         <div class='stat__label'>Promoted</div>
       </div>
       <div class='stat'>
-        <div class='stat__num'>{_esc(ready)}</div>
+        <div class='stat__num'>{ready}</div>
         <div class='stat__label'>Ready</div>
       </div>
       <div class='stat'>
-        <div class='stat__num'>{_esc(review)}</div>
+        <div class='stat__num'>{review}</div>
         <div class='stat__label'>In review</div>
       </div>
     </div>
@@ -1066,18 +1418,15 @@ python tools/promote_submission.py --submission-id sub-... --from-review</code><
 </div>
 
 <div id='submissionCards' class='cardrow'>
-{''.join(cards) if cards else "<p class='muted'>No submissions yet.</p>"}
-</div>
-
-  </section>
-</div>
 """
+    fragments = [body, *cards] if cards else [body, "<p class='muted'>No submissions yet.</p>"]
+    fragments.append("\n</div>\n\n  </section>\n</div>\n")
 
-    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
-    (docs / "submissions.html").write_text(_page("TopEquations — All Submissions", body, updated), encoding="utf-8")
+    updated = updated or _build_stamp()
+    _write_page([docs / "submissions.html"], "TopEquations — All Submissions", fragments, updated)
 
 
-def build_certificates(repo_root: Path, docs: Path) -> None:
+def build_certificates(repo_root: Path, docs: Path, updated: str | None = None) -> None:
     src_cert = repo_root / "data" / "certificates" / "equation_certificates.json"
     src_receipt = repo_root / "data" / "certificates" / "chain_publish_receipt.json"
     cert = _load_json_safe(src_cert, {"entries": []})
@@ -1085,20 +1434,20 @@ def build_certificates(repo_root: Path, docs: Path) -> None:
 
     dst_dir = docs / "data" / "certificates"
     dst_dir.mkdir(parents=True, exist_ok=True)
-    if src_cert.exists():
-        (dst_dir / "equation_certificates.json").write_text(src_cert.read_text(encoding="utf-8"), encoding="utf-8")
-    if src_receipt.exists():
-        (dst_dir / "chain_publish_receipt.json").write_text(src_receipt.read_text(encoding="utf-8"), encoding="utf-8")
+    for src in (src_cert, src_receipt):
+        if src.exists():
+            shutil.copyfile(src, dst_dir / src.name)
 
     rows: list[str] = []
     for e in cert.get("entries", []):
         eq_id = str(e.get("token_id", "")).strip()
         if not eq_id:
             continue
+        esc_id = _esc(eq_id)
         rows.append(
             f"""
-<tr id='{_esc(eq_id)}'>
-  <td><code>{_esc(eq_id)}</code></td>
+<tr id='{esc_id}'>
+  <td><code>{esc_id}</code></td>
   <td>{_esc(e.get('name', ''))}</td>
   <td>{_esc(e.get('score', ''))}</td>
   <td><code>{_esc(str(e.get('metadata_hash', ''))[:20])}…</code></td>
@@ -1157,8 +1506,8 @@ def build_certificates(repo_root: Path, docs: Path) -> None:
 </div>
 """
 
-    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
-    (docs / "certificates.html").write_text(_page("TopEquations — Certificates", body, updated), encoding="utf-8")
+    updated = updated or _build_stamp()
+    _write_html(docs / "certificates.html", _page("TopEquations — Certificates", body, updated))
 
 
 def publish_machine_readable_data(repo_root: Path, docs: Path) -> None:
@@ -1186,29 +1535,145 @@ def publish_machine_readable_data(repo_root: Path, docs: Path) -> None:
     ]
     (data_dir / "submissions.json").write_text(json.dumps(submissions_export, indent=2) + "\n", encoding="utf-8")
 
-    for name in ("core.json", "famous_equations.json"):
+    for name in _DATA_EXPORTS[2:]:
         src = repo_root / "data" / name
         if src.exists():
             shutil.copyfile(src, data_dir / name)
 
 
-def main() -> None:
+# Page builders are independent: each reads data/*.json and writes its own files.
+# Every entry lists the builder, its outputs (relative to docs/) and its data
+# inputs (relative to the repo root) for the incremental-build check.
+_PAGE_TARGETS = (
+    (build_index, ("index.html",), ("data/equations.json", "data/core.json", "data/submissions.json")),
+    (build_core, ("core.html",), ("data/core.json",)),
+    (
+        build_leaderboard,
+        ("registry.html", "leaderboard.html", "data/registry.json", "data/leaderboard.json"),
+        ("data/equations.json",),
+    ),
+    (build_rising, ("rising.html",), ("data/equations.json",)),
+    (
+        build_certificates,
+        ("certificates.html",),
+        ("data/certificates/equation_certificates.json", "data/certificates/chain_publish_receipt.json"),
+    ),
+    (build_submissions, ("submissions.html",), ("data/submissions.json", "data/equations.json")),
+    (build_harvest, ("harvest.html",), ()),
+)
+# Inputs shared by every page: the templates in this file and the assets whose
+# cache-bust token is stamped into each page.
+_SHARED_INPUTS = (
+    Path(__file__).resolve(),
+    Path("docs/assets/style.css"),
+    Path("docs/assets/app.js"),
+    Path("docs/assets/katex-init.js"),
+)
+
+
+def _needs_rebuild(outputs: list[Path], inputs: list[Path]) -> bool:
+    """True if any output is missing or older than any existing input."""
+    try:
+        oldest = min(out.stat().st_mtime_ns for out in outputs)
+    except FileNotFoundError:
+        return True
+    for src in inputs:
+        try:
+            if src.stat().st_mtime_ns > oldest:
+                return True
+        except FileNotFoundError:
+            continue
+    return False
+
+
+def _init_build_worker(repo_root: Path, prerender_math: bool, build_started: datetime) -> None:
+    # Each worker process needs its own katex pipe; the parent's cannot be shared.
+    global _build_started, _tex_renderer
+    _build_started = build_started
+    _tex_renderer = _TexRenderer(repo_root) if prerender_math else None
+
+
+def main(argv: list[str] | None = None) -> None:
+    global _build_started, _tex_renderer
+
+    ap = argparse.ArgumentParser(description="Build the GitHub Pages site (docs/) from data files")
+    ap.add_argument(
+        "--prerender-math",
+        action="store_true",
+        help="render equation blocks to HTML at build time with node + katex",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="build pages in this many worker processes (default: 1, sequential)",
+    )
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help="skip pages whose outputs are newer than all of their inputs",
+    )
+    # Callers such as promote_submission invoke main() directly; never read their argv.
+    args = ap.parse_args([] if argv is None else argv)
+
     repo_root = Path(__file__).resolve().parents[1]
     docs = repo_root / "docs"
     (docs / "assets").mkdir(parents=True, exist_ok=True)
 
-    publish_machine_readable_data(repo_root, docs)
+    # One timestamp for the whole build so every page reports the same time.
+    _build_started = datetime.now()
+    updated = _build_stamp()
+
+    # Callers that rewrite data/ and then call main() in the same process must not
+    # see parses cached under an unchanged (mtime, size) on coarse-mtime filesystems.
+    _parse_json_file.cache_clear()
+
+    # Incremental builds trust file mtimes, which fresh checkouts and coarse-mtime
+    # filesystems make unreliable, so they are opt-in. Toggling --prerender-math
+    # changes every equation block, so it always rebuilds all pages.
+    force = not args.incremental or args.prerender_math
 
-    build_index(repo_root, docs)
-    build_core(repo_root, docs)
-    build_leaderboard(repo_root, docs)
-    build_rising(repo_root, docs)
-    build_certificates(repo_root, docs)
-    build_submissions(repo_root, docs)
-    build_harvest(repo_root, docs)
+    export_inputs = [repo_root / "data" / name for name in _DATA_EXPORTS]
+    export_outputs = [
+        docs / "data" / src.name
+        for index, src in enumerate(export_inputs)
+        if index < 2 or src.exists()  # equations/submissions exports are always written
+    ]
+    if force or _needs_rebuild(export_outputs, export_inputs + [Path(__file__).resolve()]):
+        publish_machine_readable_data(repo_root, docs)
+
+    shared_inputs = [path if path.is_absolute() else repo_root / path for path in _SHARED_INPUTS]
+    builders = []
+    for builder, outputs, inputs in _PAGE_TARGETS:
+        if force or _needs_rebuild(
+            [docs / name for name in outputs],
+            [repo_root / name for name in inputs] + shared_inputs,
+        ):
+            builders.append(builder)
+
+    if args.jobs > 1 and len(builders) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(args.jobs, len(builders)),
+            initializer=_init_build_worker,
+            initargs=(repo_root, args.prerender_math, _build_started),
+        ) as pool:
+            futures = [pool.submit(builder, repo_root, docs, updated) for builder in builders]
+            for future in futures:
+                future.result()
+    else:
+        if args.prerender_math:
+            _tex_renderer = _TexRenderer(repo_root)
+        try:
+            for builder in builders:
+                builder(repo_root, docs, updated)
+        finally:
+            if _tex_renderer is not None:
+                _tex_renderer.close()
+                _tex_renderer = None
 
-    print("Built docs/*.html")
+    skipped = len(_PAGE_TARGETS) - len(builders)
+    print(f"Built docs/*.html ({len(builders)} rebuilt, {skipped} up to date)")
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
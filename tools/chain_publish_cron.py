@@ -66,6 +66,7 @@ def main() -> None:
     # Generate receipts for any promoted submissions that don't have one yet
     subs = json.loads((REPO / "data" / "submissions.json").read_text(encoding="utf-8"))
     receipts_dir = REPO / "data" / "certificates" / "receipts"
+    missing = []
     for entry in subs.get("entries", []):
         if entry.get("status") != "promoted":
             continue
@@ -73,11 +74,14 @@ def main() -> None:
         receipt_file = receipts_dir / f"receipt-{sid}.json"
         if receipt_file.exists():
             continue
-        print(f"Generating receipt for {sid}...")
+        missing.append(sid)
+    if missing:
+        # One interpreter start for the whole batch instead of one per receipt.
+        print(f"Generating receipts for {', '.join(missing)}...")
         subprocess.run(
             [
                 sys.executable, "tools/generate_submitter_receipt.py",
-                "--submission-id", sid,
+                "--submission-ids", *missing,
                 "--signer-file", args.signer_file,
             ],
             check=True,
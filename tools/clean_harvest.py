@@ -17,94 +17,139 @@ Exit code 0 always; prints summary.
 from __future__ import annotations
 
 import json
+import os
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from jsonio import json_loads  # noqa: E402
+
 REPO = Path(__file__).resolve().parents[1]
 HARVEST = REPO / "data" / "harvest" / "equation_harvest.json"
 
 # Heuristics: keep items that look like actual math.
-# "Strong" signal excludes bare digits/list markers.
-STRONG_SIGNAL = re.compile(
-    r"[=<>±≈∝→←↔]|"          # relations
-    r"[\+\*/\^_]|"          # operators / latex subscripts (exclude '-' because it appears in prose)
-    r"[()\[\]{}]|"          # grouping
-    r"[αβγδλμνπϕφθκΩΔΣΓ]|"   # common greek glyphs
-    r"(\\frac|\\dot|\\ddot|\\int|\\sum|\\prod|\\nabla|\\partial|\\sqrt|\\log|\\exp)"  # math commands
+# Signals come in three kinds:
+#   both      - structural math that also counts as a strong signal
+#               (relations, structural latex commands, d/d)
+#   structure - differentials (dx, dt): structural, but not a strong signal
+#   strong    - operators, grouping, greek glyphs and other latex commands.
+#               Bare digits/list markers and '-' (common in prose) don't count.
+_BOTH = (
+    r"[=<>±≈∝→←↔]|"                                     # relations
+    r"\\(?:frac|int|sum|prod|nabla|partial|sqrt)|"      # structural commands
+    r"\bd/d\b"
 )
-
-WEAK_PROSE = re.compile(r"^[A-Za-z\s:;,'\-]+$")
-
-# Markdown-ish junk captured from $...$ or bracket blocks
-MD_JUNK = re.compile(r"^\s*(\d+\.|[-*])\s+\*\*.*\*\*\s*$")
-
-MOSTLY_WORDS = re.compile(r"^[A-Za-z\s,;:\-']+$")
-WORD_TOKEN = re.compile(r"[A-Za-z]+")
-
-# Extra structural math markers (beyond STRONG_SIGNAL)
-STRUCTURE = re.compile(
-    r"(\\frac|\\int|\\sum|\\prod|\\nabla|\\partial|\\sqrt)|"
-    r"\b(d/d|dx|dt)\b|"
-    r"[=<>±≈∝→←↔]"
+_STRUCTURE_ONLY = r"\b(?:dx|dt)\b"
+_STRONG_ONLY = (
+    r"[\+\*/\^_]|"                                      # operators / latex subscripts
+    r"[()\[\]{}]|"                                      # grouping
+    r"[αβγδλμνπϕφθκΩΔΣΓ]|"                              # common greek glyphs
+    r"\\(?:dot|ddot|log|exp)"                           # other math commands
 )
+# One alternation finds the first signal of any kind; the named group that
+# fired tells is_bad which kind it was.
+SIGNAL = re.compile(
+    f"(?P<both>{_BOTH})|(?P<structure>{_STRUCTURE_ONLY})|(?P<strong>{_STRONG_ONLY})"
+)
+STRONG_SIGNAL = re.compile(f"{_BOTH}|{_STRONG_ONLY}")
+STRUCTURE = re.compile(f"{_BOTH}|{_STRUCTURE_ONLY}")
+_STRONG, _STRUCTURE = 1, 2
+_SIGNAL_BITS = {"both": _STRONG | _STRUCTURE, "structure": _STRUCTURE, "strong": _STRONG}
 
+MOSTLY_WORDS = re.compile(r"^[A-Za-z\s,;:\-']+$")
+# Sentence-like prose has at least PROSE_WORDS ASCII words. Matching that many
+# from the start answers ">= N words?" without building a list of every word,
+# and stops scanning as soon as the Nth word is seen.
+PROSE_WORDS = 8
+ENOUGH_WORDS = re.compile(r"[^A-Za-z]*+(?:[A-Za-z]++[^A-Za-z]*+){%d}" % PROSE_WORDS)
+
+# Possessive quantifiers (re, Python 3.11+): whitespace runs are never re-split,
+# so long runs can't trigger backtracking.
 PROSE_PREFIX = re.compile(
-    r"^(for\s+|and\s+|to\s+|can\s+|is\s+|example\s*:|implementation\s+note)",
+    r"^(for\s++|and\s++|to\s++|can\s++|is\s++|example\s*+:|implementation\s++note)",
     re.IGNORECASE,
 )
 
 
-def is_bad(eq: object) -> bool:
+# The compiled-pattern methods are bound as defaults below so the per-entry
+# hot path uses fast locals instead of global + attribute lookups.
+def _signals(
+    s: str,
+    _search=SIGNAL.search,
+    _search_strong=STRONG_SIGNAL.search,
+    _search_structure=STRUCTURE.search,
+    _bits=_SIGNAL_BITS,
+) -> int:
+    """Bitmask of the math signals in s.
+
+    Most equations hit a 'both' signal (usually '=') on the first search. If the
+    first signal is only one kind, a single C-level search for the other kind
+    covers the rest of the string; no signal can start inside the first match.
+    """
+    m = _search(s)
+    if m is None:
+        return 0
+    flags = _bits[m.lastgroup]
+    if flags == _STRONG:
+        if _search_structure(s, m.end()):
+            flags |= _STRUCTURE
+    elif flags == _STRUCTURE:
+        if _search_strong(s, m.end()):
+            flags |= _STRONG
+    return flags
+
+
+def is_bad(
+    eq: object,
+    _signals=_signals,
+    _match_words=ENOUGH_WORDS.match,
+    _match_prose=PROSE_PREFIX.match,
+) -> bool:
     if eq is None:
         return True
     s = str(eq).strip()
-    if not s:
-        return True
-    low = s.lower()
-    if low in {"none", "null"}:
-        return True
-
-    # Markdown-ish junk
-    if MD_JUNK.match(s) or "**" in s:
-        return True
 
-    # Drop weak prose strings (letters/punct only) unless they have real structure.
-    if WEAK_PROSE.match(s) and not STRUCTURE.search(s):
-        return True
-
-    # Require at least some strong math signal.
-    if not STRONG_SIGNAL.search(s):
-        return True
-
-    # Drop sentence-like prose false positives.
-    words = len(WORD_TOKEN.findall(s))
-    has_structure = bool(STRUCTURE.search(s))
-    if words >= 8 and not has_structure:
+    # Blank or super-short fragments are usually junk.
+    if len(s) < 4:
         return True
-
-    # Common prose lead-ins from extracted narrative text.
-    if PROSE_PREFIX.search(s) and not has_structure:
+    if s.lower() in {"none", "null"}:
         return True
 
-    # Full-sentence style text with weak/no symbolic relation is usually junk.
-    if s.endswith((".", ";")) and words >= 8 and not has_structure:
+    # Markdown-ish junk, e.g. "1. **Bold**" captured from $...$ or bracket blocks
+    if "**" in s:
         return True
 
-    # Super-short fragments are usually junk.
-    if len(s) < 4:
+    # Require at least some strong math signal. Weak prose strings (letters and
+    # punctuation only) never have one, so they are dropped here as well.
+    flags = _signals(s)
+    if not flags & _STRONG:
         return True
+    if flags & _STRUCTURE:
+        return False
 
-    return False
+    # Without structure, drop sentence-like prose false positives and common
+    # prose lead-ins from extracted narrative text.
+    return _match_words(s) is not None or _match_prose(s) is not None
 
 
 def main() -> None:
-    data = json.loads(HARVEST.read_text(encoding="utf-8"))
+    data = json_loads(HARVEST.read_bytes())
     entries = list(data.get("entries", []))
 
     before = len(entries)
     # Remove code captures (Python/JS lines) — harvest UI should be equation-first.
     # If we ever want code back, we can add a CLI flag; for now keep LaTeX/math-only.
-    kept = [e for e in entries if str(e.get("kind", "")).lower() != "code" and not is_bad(e.get("equation"))]
+    # One pass filters and tallies kinds for the stats block.
+    kept = []
+    by_kind: dict[str, int] = {}
+    for e in entries:
+        kind = e.get("kind", "unknown")
+        if str(kind).lower() == "code" or is_bad(e.get("equation")):
+            continue
+        kept.append(e)
+        k = str(kind)
+        by_kind[k] = by_kind.get(k, 0) + 1
     removed = before - len(kept)
 
     data["entries"] = kept
@@ -112,16 +157,17 @@ def main() -> None:
     # Recompute simple stats
     stats = data.get("stats", {}) or {}
     stats["unique"] = len(kept)
-
-    by_kind: dict[str, int] = {}
-    for e in kept:
-        k = str(e.get("kind", "unknown"))
-        by_kind[k] = by_kind.get(k, 0) + 1
     stats["by_kind"] = by_kind
 
     data["stats"] = stats
 
-    HARVEST.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    # Stream the encoder's chunks into a sibling temp file, then swap it in, so the
+    # full JSON text is never held in memory and a crash can't truncate HARVEST.
+    tmp = HARVEST.with_name(HARVEST.name + ".tmp")
+    with tmp.open("w", encoding="utf-8", newline="\n", buffering=1 << 16) as fh:
+        json.dump(data, fh, indent=2, ensure_ascii=False)
+        fh.write("\n")
+    os.replace(tmp, HARVEST)
     print(f"clean_harvest: before={before} removed={removed} after={len(kept)}")
 
 
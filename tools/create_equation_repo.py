@@ -8,46 +8,105 @@ Usage:
     python tools/create_equation_repo.py --all --tier derived
     python tools/create_equation_repo.py --all --tier core
     python tools/create_equation_repo.py --all
+    python tools/create_equation_repo.py --all --jobs 8
 
 Requires: gh CLI authenticated (gh auth login)
 """
 from __future__ import annotations
 
 import argparse
+import atexit
+import base64
 import json
+import os
 import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from jsonio import json_loads  # noqa: E402
+
 REPO = Path(__file__).resolve().parents[1]
 GITHUB_ORG = "RDM3DC"
 
-
 def _load(path: Path) -> dict:
     if not path.exists():
         return {"entries": []}
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json_loads(path.read_bytes())
 
 
 def _save(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    # Stream through a 64 KiB buffer into a sibling temp file, then swap it in,
+    # so the JSON text is never built whole and the data file is never torn.
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8", newline="\n", buffering=1 << 16) as fh:
+        json.dump(data, fh, indent=2, ensure_ascii=False)
+        fh.write("\n")
+    os.replace(tmp, path)
+
+
+_SLUG_OK = re.compile(r"[a-z0-9]++(?:-[a-z0-9]++)*+")
+# A run of dashes and/or invalid characters collapses to one dash, which is
+# the same as replacing invalid characters and then squeezing dashes.
+_SLUG_BAD = re.compile(r"[^a-z0-9]++")
 
 
 def _slug(equation_id: str) -> str:
     """Convert equation ID to a valid GitHub repo name."""
     # eq-arp-redshift -> eq-arp-redshift (already fine)
     # core-phase-ambiguity -> core-phase-ambiguity
-    slug = re.sub(r"[^a-z0-9-]", "-", equation_id.lower())
-    slug = re.sub(r"-+", "-", slug).strip("-")
-    return slug
+    slug = equation_id.lower()
+    if _SLUG_OK.fullmatch(slug):
+        return slug
+    return _SLUG_BAD.sub("-", slug).strip("-")
 
 
 def _repo_name(equation_id: str) -> str:
     return _slug(equation_id)
 
 
-def _repo_exists(repo_name: str) -> bool:
+# Repos confirmed to exist, persisted between runs so re-runs of --all or
+# --update-links skip the gh round-trips. Only positive answers are cached (a
+# repo never stops existing here), and each expires after a day.
+_EXISTS_CACHE = REPO / ".cache" / "repo_exists.json"
+_EXISTS_TTL_S = 24 * 60 * 60
+_exists_seen: dict[str, float] | None = None
+
+
+def _exists_cache() -> dict[str, float]:
+    global _exists_seen
+    if _exists_seen is None:
+        try:
+            raw = json_loads(_EXISTS_CACHE.read_bytes())
+        except (OSError, ValueError):
+            raw = {}
+        cutoff = time.time() - _EXISTS_TTL_S
+        _exists_seen = {
+            name: seen
+            for name, seen in (raw.items() if isinstance(raw, dict) else ())
+            if isinstance(seen, (int, float)) and seen > cutoff
+        }
+        atexit.register(_save_exists_cache)
+    return _exists_seen
+
+
+def _save_exists_cache() -> None:
+    try:
+        _EXISTS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _EXISTS_CACHE.write_text(json.dumps(_exists_seen or {}, sort_keys=True), encoding="utf-8")
+    except OSError:
+        # The cache is an optimization only; never fail the run over it.
+        pass
+
+
+def _mark_exists(repo_name: str) -> None:
+    _exists_cache()[repo_name] = time.time()
+
+
+def _gh_repo_exists(repo_name: str) -> bool:
     result = subprocess.run(
         ["gh", "repo", "view", f"{GITHUB_ORG}/{repo_name}", "--json", "name"],
         capture_output=True, text=True,
@@ -55,6 +114,78 @@ def _repo_exists(repo_name: str) -> bool:
     return result.returncode == 0
 
 
+def _repo_exists(repo_name: str) -> bool:
+    if repo_name in _exists_cache():
+        return True
+    if _gh_repo_exists(repo_name):
+        _mark_exists(repo_name)
+        return True
+    return False
+
+
+# Repositories looked up per GraphQL request; GitHub caps query complexity.
+_GRAPHQL_BATCH = 100
+
+
+def _existing_repos(repo_names: list[str]) -> set[str]:
+    """Return which of repo_names exist under GITHUB_ORG, batching the lookups.
+
+    One `gh api graphql` call covers up to _GRAPHQL_BATCH repositories instead
+    of one `gh repo view` process per repo. A batch whose response cannot be
+    read falls back to per-repo checks.
+    """
+    cached = _exists_cache()
+    names = list(dict.fromkeys(n for n in repo_names if n))
+    existing = {n for n in names if n in cached}
+    names = [n for n in names if n not in existing]
+    for start in range(0, len(names), _GRAPHQL_BATCH):
+        batch = names[start:start + _GRAPHQL_BATCH]
+        fields = " ".join(
+            f"r{i}: repository(owner: {json.dumps(GITHUB_ORG)}, name: {json.dumps(n)}) {{ name }}"
+            for i, n in enumerate(batch)
+        )
+        # Missing repos come back as null aliases plus NOT_FOUND errors, which
+        # makes gh exit non-zero, so read stdout regardless of the exit code.
+        result = subprocess.run(
+            ["gh", "api", "graphql", "-f", f"query=query {{ {fields} }}"],
+            capture_output=True, text=True,
+        )
+        try:
+            data = json.loads(result.stdout).get("data")
+        except (ValueError, AttributeError):
+            data = None
+        if not isinstance(data, dict):
+            found = [n for n in batch if _gh_repo_exists(n)]
+        else:
+            found = [n for i, n in enumerate(batch) if data.get(f"r{i}")]
+        for n in found:
+            _mark_exists(n)
+        existing.update(found)
+    return existing
+
+
+_README_FOOTER = (
+    "## Repository Structure\n"
+    "\n"
+    "```\n"
+    "images/       # Visualizations, plots, diagrams\n"
+    "derivations/  # Step-by-step derivations and proofs\n"
+    "simulations/  # Computational models and code\n"
+    "data/         # Numerical data, experimental results\n"
+    "notes/        # Research notes and references\n"
+    "```\n"
+    "\n"
+    "## Links\n"
+    "\n"
+    "- [TopEquations Registry](https://rdm3dc.github.io/TopEquations/registry.html)\n"
+    f"- [TopEquations Main Repo](https://github.com/{GITHUB_ORG}/TopEquations)\n"
+    "- [Certificates](https://rdm3dc.github.io/TopEquations/certificates.html)\n"
+    "\n"
+    "---\n"
+    f"*Part of the [TopEquations](https://github.com/{GITHUB_ORG}/TopEquations) project.*\n"
+)
+
+
 def _build_readme(entry: dict, tier: str) -> str:
     name = entry.get("name", "Unnamed Equation")
     eq_id = entry.get("id", "")
@@ -69,117 +200,101 @@ def _build_readme(entry: dict, tier: str) -> str:
     units = entry.get("units", "")
     theory = entry.get("theory", "")
 
-    lines = [
-        f"# {name}",
-        "",
-    ]
-    if subtitle:
-        lines.append(f"*{subtitle}*")
-        lines.append("")
-
-    lines.extend([
-        f"**ID:** `{eq_id}`  ",
-        f"**Tier:** {tier}  ",
-    ])
-    if score:
-        lines.append(f"**Score:** {score}  ")
-    if units:
-        lines.append(f"**Units:** {units}  ")
-    if theory:
-        lines.append(f"**Theory:** {theory}  ")
-
-    lines.extend([
-        "",
-        "## Equation",
-        "",
-        "$$",
-        latex,
-        "$$",
-        "",
-    ])
-
-    if desc:
-        lines.extend([
-            "## Description",
-            "",
-            desc,
-            "",
-        ])
-
+    # Optional sections render to "" so the README is one f-string below.
+    subtitle_md = f"*{subtitle}*\n\n" if subtitle else ""
+    score_md = f"**Score:** {score}  \n" if score else ""
+    units_md = f"**Units:** {units}  \n" if units else ""
+    theory_md = f"**Theory:** {theory}  \n" if theory else ""
+    desc_md = f"## Description\n\n{desc}\n\n" if desc else ""
+    assumptions_md = ""
     if assumptions:
-        lines.extend(["## Assumptions", ""])
-        for a in assumptions:
-            lines.append(f"- {a}")
-        lines.append("")
-
+        items = "".join(f"- {a}\n" for a in assumptions)
+        assumptions_md = f"## Assumptions\n\n{items}\n"
+    evidence_md = ""
     if evidence:
-        lines.extend(["## Evidence", ""])
-        for e in evidence:
-            if isinstance(e, dict):
-                lines.append(f"- {e.get('label', str(e))}")
-            else:
-                lines.append(f"- {e}")
-        lines.append("")
-
-    lines.extend([
-        "## Repository Structure",
-        "",
-        "```",
-        "images/       # Visualizations, plots, diagrams",
-        "derivations/  # Step-by-step derivations and proofs",
-        "simulations/  # Computational models and code",
-        "data/         # Numerical data, experimental results",
-        "notes/        # Research notes and references",
-        "```",
-        "",
-        "## Links",
-        "",
-        f"- [TopEquations Registry](https://rdm3dc.github.io/TopEquations/registry.html)",
-        f"- [TopEquations Main Repo](https://github.com/{GITHUB_ORG}/TopEquations)",
-        f"- [Certificates](https://rdm3dc.github.io/TopEquations/certificates.html)",
-        "",
-        "---",
-        f"*Part of the [TopEquations](https://github.com/{GITHUB_ORG}/TopEquations) project.*",
-        "",
-    ])
-
-    return "\n".join(lines)
-
-
-def _create_repo(entry: dict, tier: str, dry_run: bool = False) -> str | None:
-    eq_id = entry.get("id", "")
-    repo_name = _repo_name(eq_id)
-    full_name = f"{GITHUB_ORG}/{repo_name}"
-    name = entry.get("name", "Unnamed")
+        items = "".join(
+            f"- {e.get('label', str(e))}\n" if isinstance(e, dict) else f"- {e}\n"
+            for e in evidence
+        )
+        evidence_md = f"## Evidence\n\n{items}\n"
+
+    return (
+        f"# {name}\n\n"
+        f"{subtitle_md}"
+        f"**ID:** `{eq_id}`  \n"
+        f"**Tier:** {tier}  \n"
+        f"{score_md}{units_md}{theory_md}"
+        f"\n## Equation\n\n$$\n{latex}\n$$\n\n"
+        f"{desc_md}{assumptions_md}{evidence_md}"
+        f"{_README_FOOTER}"
+    )
 
-    if _repo_exists(repo_name):
-        print(f"  exists: {full_name}")
-        return f"https://github.com/{full_name}"
 
-    if dry_run:
-        safe_name = name.encode("ascii", errors="replace").decode("ascii")
-        print(f"  would create: {full_name} -- {safe_name}")
-        return None
+_REPO_FOLDERS = ("images", "derivations", "simulations", "data", "notes")
 
-    desc = f"TopEquations: {name}"[:350]
+_CREATE_COMMIT_MUTATION = """
+mutation($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) { commit { oid } }
+}
+"""
+
+
+def _repo_files(entry: dict, tier: str) -> dict[str, str]:
+    """README plus a .gitkeep per folder, keyed by repo-relative path."""
+    files = {"README.md": _build_readme(entry, tier)}
+    for folder in _REPO_FOLDERS:
+        files[f"{folder}/.gitkeep"] = ""
+    return files
 
-    # Create the repo
+
+def _gh_json(args: list[str], payload: dict | None = None):
+    """Run a `gh api` call and parse its JSON output; None on failure."""
     result = subprocess.run(
-        [
-            "gh", "repo", "create", full_name,
-            "--public",
-            "--description", desc,
-            "--clone=false",
-        ],
+        ["gh", "api", *args],
+        input=json.dumps(payload) if payload is not None else None,
         capture_output=True, text=True,
     )
     if result.returncode != 0:
-        print(f"  FAILED to create {full_name}: {result.stderr.strip()[:200]}", file=sys.stderr)
+        return None
+    try:
+        return json.loads(result.stdout)
+    except ValueError:
         return None
 
-    print(f"  created: {full_name}")
 
-    # Initialize with README and folder structure via a temp clone
+def _init_repo_via_api(full_name: str, files: dict[str, str], message: str) -> bool:
+    """Add every file in one commit with the createCommitOnBranch mutation.
+
+    Needs an existing branch head (the repo is created with --add-readme).
+    """
+    repo = _gh_json([f"repos/{full_name}"])
+    branch = (repo or {}).get("default_branch") or "main"
+    ref = _gh_json([f"repos/{full_name}/git/ref/heads/{branch}"])
+    head_oid = ((ref or {}).get("object") or {}).get("sha")
+    if not head_oid:
+        return False
+    additions = [
+        {"path": path, "contents": base64.b64encode(text.encode("utf-8")).decode("ascii")}
+        for path, text in files.items()
+    ]
+    payload = {
+        "query": _CREATE_COMMIT_MUTATION,
+        "variables": {
+            "input": {
+                "branch": {"repositoryNameWithOwner": full_name, "branchName": branch},
+                "message": {"headline": message},
+                "expectedHeadOid": head_oid,
+                "fileChanges": {"additions": additions},
+            },
+        },
+    }
+    response = _gh_json(["graphql", "--input", "-"], payload)
+    commit = (((response or {}).get("data") or {}).get("createCommitOnBranch") or {}).get("commit")
+    return bool(commit)
+
+
+def _init_repo_via_git(full_name: str, repo_name: str, files: dict[str, str], message: str) -> None:
+    """Legacy path: clone the empty repo, write the files, commit and push."""
     import tempfile
     with tempfile.TemporaryDirectory() as tmp:
         tmp_path = Path(tmp) / repo_name
@@ -188,21 +303,17 @@ def _create_repo(entry: dict, tier: str, dry_run: bool = False) -> str | None:
             capture_output=True, text=True,
         )
 
-        # Write README
-        readme = _build_readme(entry, tier)
-        (tmp_path / "README.md").write_text(readme, encoding="utf-8")
-
-        # Create folder structure with .gitkeep files
-        for folder in ["images", "derivations", "simulations", "data", "notes"]:
-            (tmp_path / folder).mkdir(exist_ok=True)
-            (tmp_path / folder / ".gitkeep").write_text("", encoding="utf-8")
+        for rel, text in files.items():
+            target = tmp_path / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(text, encoding="utf-8")
 
         # Commit and push
         subprocess.run(["git", "add", "-A"], cwd=str(tmp_path), capture_output=True)
         subprocess.run(
-            ["git", "commit", "-m", f"Initialize equation repo: {name}"],
+            ["git", "commit", "-m", message],
             cwd=str(tmp_path), capture_output=True,
-            env={**__import__("os").environ, "GIT_AUTHOR_NAME": "TopEquations Bot",
+            env={**os.environ, "GIT_AUTHOR_NAME": "TopEquations Bot",
                  "GIT_COMMITTER_NAME": "TopEquations Bot",
                  "GIT_AUTHOR_EMAIL": "bot@topequations.local",
                  "GIT_COMMITTER_EMAIL": "bot@topequations.local"},
@@ -218,13 +329,70 @@ def _create_repo(entry: dict, tier: str, dry_run: bool = False) -> str | None:
                 cwd=str(tmp_path), capture_output=True, text=True,
             )
 
+
+def _create_repo(
+    entry: dict,
+    tier: str,
+    dry_run: bool = False,
+    exists: bool | None = None,
+    legacy_git: bool = False,
+) -> str | None:
+    eq_id = entry.get("id", "")
+    repo_name = _repo_name(eq_id)
+    full_name = f"{GITHUB_ORG}/{repo_name}"
+    name = entry.get("name", "Unnamed")
+
+    if exists is None:
+        exists = _repo_exists(repo_name)
+    if exists:
+        print(f"  exists: {full_name}")
+        return f"https://github.com/{full_name}"
+
+    if dry_run:
+        safe_name = name.encode("ascii", errors="replace").decode("ascii")
+        print(f"  would create: {full_name} -- {safe_name}")
+        return None
+
+    desc = f"TopEquations: {name}"[:350]
+
+    # Create the repo. The API path commits on top of an initial README, so it
+    # asks GitHub to create one; the legacy git path pushes into an empty repo.
+    result = subprocess.run(
+        [
+            "gh", "repo", "create", full_name,
+            "--public",
+            "--description", desc,
+            "--clone=false",
+            *(() if legacy_git else ("--add-readme",)),
+        ],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        print(f"  FAILED to create {full_name}: {result.stderr.strip()[:200]}", file=sys.stderr)
+        return None
+
+    print(f"  created: {full_name}")
+    _mark_exists(repo_name)
+
+    # Initialize with README and folder structure
+    files = _repo_files(entry, tier)
+    message = f"Initialize equation repo: {name}"
+    if legacy_git:
+        _init_repo_via_git(full_name, repo_name, files, message)
+    elif not _init_repo_via_api(full_name, files, message):
+        print(f"  FAILED to add initial files to {full_name}", file=sys.stderr)
+
     repo_url = f"https://github.com/{full_name}"
     print(f"  initialized: {repo_url}")
     return repo_url
 
 
-def _find_entry(equation_id: str) -> tuple[dict, str] | None:
-    """Find an equation by ID across all data files. Returns (entry, tier)."""
+def _find_entry(equation_id: str) -> tuple[dict, str, Path, dict] | None:
+    """Find an equation by ID across all data files.
+
+    Returns (entry, tier, path, data), where data is the loaded file the entry
+    belongs to, so callers can save it back without re-reading.
+    """
     for path, tier in [
         (REPO / "data" / "equations.json", "derived"),
         (REPO / "data" / "core.json", "core"),
@@ -233,12 +401,16 @@ def _find_entry(equation_id: str) -> tuple[dict, str] | None:
         data = _load(path)
         for e in data.get("entries", []):
             if e.get("id") == equation_id:
-                return e, tier
+                return e, tier, path, data
     return None
 
 
-def _all_entries(tier_filter: str | None) -> list[tuple[dict, str, Path]]:
-    """Get all entries, optionally filtered by tier."""
+def _all_entries(tier_filter: str | None) -> list[tuple[dict, str, Path, dict]]:
+    """Get all entries, optionally filtered by tier.
+
+    Each tuple carries the loaded top-level data of its file (shared by all
+    entries from that file).
+    """
     results = []
     sources = [
         (REPO / "data" / "core.json", "core"),
@@ -250,7 +422,7 @@ def _all_entries(tier_filter: str | None) -> list[tuple[dict, str, Path]]:
             continue
         data = _load(path)
         for e in data.get("entries", []):
-            results.append((e, tier, path))
+            results.append((e, tier, path, data))
     return results
 
 
@@ -262,55 +434,95 @@ def main() -> None:
     ap.add_argument("--tier", choices=["core", "derived", "famous"],
                      help="Filter by tier (only with --all)")
     ap.add_argument("--dry-run", action="store_true", help="Show what would be created without doing it")
+    ap.add_argument("--jobs", type=int, default=1,
+                     help="With --all, create this many repos concurrently (default: 1)")
+    ap.add_argument("--legacy-git", action="store_true",
+                     help="Initialize new repos via git clone/commit/push instead of the API")
     ap.add_argument("--update-links", action="store_true",
                      help="Update data files with repoUrl for existing repos")
     args = ap.parse_args()
 
     created = 0
     updated = 0
+    # Data files already parsed for this run, and those whose entries changed.
+    loaded: dict[Path, dict] = {}
+    dirty: set[Path] = set()
 
     if args.equation_id:
         found = _find_entry(args.equation_id)
         if not found:
             raise SystemExit(f"equation not found: {args.equation_id}")
-        entry, tier = found
-        url = _create_repo(entry, tier, dry_run=args.dry_run)
+        entry, tier, path, data = found
+        loaded[path] = data
+        url = _create_repo(entry, tier, dry_run=args.dry_run, legacy_git=args.legacy_git)
         if url:
             entry["repoUrl"] = url
+            dirty.add(path)
             created += 1
     else:
         entries = _all_entries(args.tier)
         print(f"Processing {len(entries)} equations...")
-        for entry, tier, data_path in entries:
-            eq_id = entry.get("id", "")
-            if not eq_id:
-                continue
+        for _, _, path, data in entries:
+            loaded[path] = data
+        existing = _existing_repos([_repo_name(e.get("id", "")) for e, _, _, _ in entries])
+        work = [(entry, tier, path) for entry, tier, path, _ in entries if entry.get("id", "")]
+
+        def create(item: tuple[dict, str, Path]) -> str | None:
+            entry, tier, _ = item
+            eq_id = entry["id"]
             print(f"[{tier}] {eq_id}")
-            url = _create_repo(entry, tier, dry_run=args.dry_run)
+            exists = _repo_name(eq_id) in existing
+            return _create_repo(
+                entry, tier, dry_run=args.dry_run, exists=exists, legacy_git=args.legacy_git,
+            )
+
+        # Repo creation is network-bound (gh + git clone/push), so threads overlap
+        # the waits. Results come back in input order and are applied here, on
+        # the main thread, so the shared entry dicts are never written concurrently.
+        if args.jobs > 1 and len(work) > 1:
+            with ThreadPoolExecutor(max_workers=min(args.jobs, len(work))) as pool:
+                urls = list(pool.map(create, work))
+        else:
+            urls = [create(item) for item in work]
+        for (entry, _, path), url in zip(work, urls):
             if url:
-                entry["repoUrl"] = url
+                if entry.get("repoUrl") != url:
+                    entry["repoUrl"] = url
+                    dirty.add(path)
                 created += 1
 
-    # Save updated data files with repoUrl links
+    # Save updated data files with repoUrl links, reusing the dicts parsed above
+    # (and mutated in place) rather than re-reading them from disk.
     if not args.dry_run and (created > 0 or args.update_links):
-        for path, tier in [
-            (REPO / "data" / "equations.json", "derived"),
-            (REPO / "data" / "core.json", "core"),
-            (REPO / "data" / "famous_equations.json", "famous"),
-        ]:
-            data = _load(path)
-            changed = False
+        for path in (
+            REPO / "data" / "equations.json",
+            REPO / "data" / "core.json",
+            REPO / "data" / "famous_equations.json",
+        ):
+            if path not in loaded:
+                loaded[path] = _load(path)
+        existing = set()
+        if not args.update_links:
+            # One batched lookup for every entry whose link would change.
+            stale = []
+            for data in loaded.values():
+                for entry in data.get("entries", []):
+                    repo_name = _repo_name(entry.get("id", ""))
+                    if entry.get("repoUrl") != f"https://github.com/{GITHUB_ORG}/{repo_name}":
+                        stale.append(repo_name)
+            existing = _existing_repos(stale)
+        for path, data in loaded.items():
             for entry in data.get("entries", []):
                 eq_id = entry.get("id", "")
                 repo_name = _repo_name(eq_id)
                 expected_url = f"https://github.com/{GITHUB_ORG}/{repo_name}"
                 if entry.get("repoUrl") != expected_url:
-                    if args.update_links or _repo_exists(repo_name):
+                    if args.update_links or repo_name in existing:
                         entry["repoUrl"] = expected_url
-                        changed = True
+                        dirty.add(path)
                         updated += 1
-            if changed:
-                _save(path, data)
+        for path in dirty:
+            _save(path, loaded[path])
 
     print(f"\nDone. Created: {created}, Updated links: {updated}")
 
@@ -16,34 +16,61 @@ BZ ruler self-consistency:
   m_eff = m₀ / √(1 − ε_eff²),  ε_c = √3/2 ≈ 0.8660
 """
 
+from functools import lru_cache
+
 import numpy as np
 from scipy.integrate import solve_ivp
 
+try:
+    from numba import njit
+except ImportError:  # optional: without numba the ODE callback runs as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 # ══════════════════════════════════════════════════════════════════
 # FHS Chern helper (Fukui–Hatsugai–Suzuki, integer-quantised)
 # ══════════════════════════════════════════════════════════════════
-def chern_fhs_qwz(m: float, N: int = 31) -> int:
+@lru_cache(maxsize=None)
+def _bz_grid(N: int):
+    """sin kx, sin ky and cos kx + cos ky on the N×N grid (shared, read-only)."""
     kx = np.linspace(0, 2 * np.pi, N, endpoint=False)
     ky = np.linspace(0, 2 * np.pi, N, endpoint=False)
     KX, KY = np.meshgrid(kx, ky, indexing="ij")
-    SX, SY = np.sin(KX), np.sin(KY)
-    CX, CY = np.cos(KX), np.cos(KY)
-    dz = m + CX + CY
+    grid = (np.sin(KX), np.sin(KY), np.cos(KX) + np.cos(KY))
+    for arr in grid:
+        arr.setflags(write=False)  # cached and shared between calls
+    return grid
+
+
+def chern_fhs_qwz_batched(m_array, N: int = 31) -> np.ndarray:
+    """Chern numbers for a batch of masses in one pass (leading axis = mass)."""
+    SX, SY, CXY = _bz_grid(N)
+    dz = np.asarray(m_array, dtype=float)[:, None, None] + CXY
     E = np.sqrt(SX**2 + SY**2 + dz**2)
 
-    H = np.empty((N, N, 2, 2), dtype=complex)
-    H[..., 0, 0] = dz;             H[..., 1, 1] = -dz
-    H[..., 0, 1] = SX - 1j * SY;  H[..., 1, 0] = SX + 1j * SY
-    _, vecs = np.linalg.eigh(H)
-    u = vecs[..., :, 0]  # lower band
+    # Lower-band eigenvector of H = [[dz, SX−iSY], [SX+iSY, −dz]] in closed
+    # form (no eigh). Either row of (H + E)u = 0 gives it; take the row that
+    # cannot vanish, (SX−iSY, −(dz+E)) for dz ≥ 0 and (dz−E, SX+iSY) below.
+    # Both have |u|² = 2E(E+|dz|); the positive scale drops out of the FHS
+    # link phases, so u is left unnormalised.
+    upper = dz >= 0
+    u0 = np.where(upper, SX - 1j * SY, dz - E)
+    u1 = np.where(upper, -(dz + E), SX + 1j * SY)
+
+    # FHS links ⟨u(k)|u(k+x̂)⟩, ⟨u(k)|u(k+ŷ)⟩, each computed once; the plaquette
+    # is Ux(k)·Uy(k+x̂)·Ux(k+ŷ)*·Uy(k)*. np.angle(0) is 0, so an exact gap
+    # closing (u = 0 on a grid point) just contributes no flux.
+    c0, c1 = u0.conj(), u1.conj()
+    Ux = c0 * np.roll(u0, -1, 1) + c1 * np.roll(u1, -1, 1)
+    Uy = c0 * np.roll(u0, -1, 2) + c1 * np.roll(u1, -1, 2)
+    F = np.angle(Ux * np.roll(Uy, -1, 1) * np.conj(np.roll(Ux, -1, 2) * Uy))
+    return np.rint(F.sum(axis=(1, 2)) / (2 * np.pi)).astype(int)
 
-    u2 = np.roll(u, -1, 0)
-    u3 = np.roll(u2, -1, 1)
-    u4 = np.roll(u, -1, 1)
-    dot = lambda a, b: (np.conj(a) * b).sum(-1)
-    F = np.imag(np.log(dot(u, u2) * dot(u2, u3)
-                      * dot(u3, u4) * dot(u4, u)))
-    return int(np.rint(F.sum() / (2 * np.pi)))
+
+def chern_fhs_qwz(m: float, N: int = 31) -> int:
+    return int(chern_fhs_qwz_batched([m], N)[0])
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -65,15 +92,17 @@ T_ij     = 10.0          # effective temperature (higher = less dissipation)
 eps_max  = 1.0
 t_ramp   = 100.0
 
+@njit(cache=True, fastmath=True)
 def eps_of_t(t):
     """Ramp ε from 0 to eps_max linearly."""
     return min(eps_max, max(0.0, t / t_ramp * eps_max))
 
 def m_eff_of_eps(eps):
-    """BZ-averaged ruler coupling: m_eff = m₀/√(1−ε²)."""
-    e2 = min(eps**2, 0.9999)
+    """BZ-averaged ruler coupling: m_eff = m₀/√(1−ε²). Accepts arrays."""
+    e2 = np.minimum(eps**2, 0.9999)
     return m0 / np.sqrt(1 - e2)
 
+@njit(cache=True, fastmath=True)
 def drive_current(t):
     """External current drive |I|e^{iθ} — oscillating with ε-dependent envelope."""
     eps = eps_of_t(t)
@@ -81,9 +110,11 @@ def drive_current(t):
     theta = 2.0 * t + 0.3 * np.sin(0.7 * t)  # nonlinear phase
     return amp, theta
 
+@njit(cache=True, fastmath=True)
 def alpha_G(S):
     return alpha0 / (1 + np.exp((S - Sc) / dS_gate))
 
+@njit(cache=True, fastmath=True)
 def mu_G(S):
     return mu0 * (S / S0)
 
@@ -91,39 +122,30 @@ def mu_G(S):
 # ══════════════════════════════════════════════════════════════════
 # ODE system: y = [Re(G̃), Im(G̃), S, w_cumulative]
 # ══════════════════════════════════════════════════════════════════
-theta_R_prev = [0.0]   # mutable, for Phase-Lift state
-w_prev       = [0]     # sheet index
-
+@njit(cache=True, fastmath=True)
 def rhs(t, y):
-    G_re, G_im, S, w_cum = y
-    G = complex(G_re, G_im)
+    G_re, G_im, S = y[0], y[1], y[2]
 
     # Drive
     I_amp, theta_raw = drive_current(t)
 
     # ── Phase-Lift (Core Eq. 2–4) ────────────────────────────────
-    eps = eps_of_t(t)
-    pi_a = np.pi * (1 + eps)    # simplified: BZ-uniform ruler at ε(t)
-    period = 2 * pi_a
-
-    # Nearest-sheet unwrap
-    diff = theta_raw - theta_R_prev[0]
-    m = round(diff / period) if period > 1e-10 else 0
-    # Clamp m to avoid runaway
-    m = max(-5, min(5, m))
-    theta_R = theta_raw - m * period
-    theta_R_prev[0] = theta_R
-
-    # Sheet-jump slip event
-    delta_w = abs(m - w_prev[0]) if abs(m) > 0 else 0
-    w_prev[0] = m
+    # θ_R is the nearest-sheet lift of θ_raw onto sheets of period 2π(1+ε).
+    # drive_current's phase is continuous in t, the run starts on sheet 0, and
+    # a solver step moves it by ≲ 2% of a period (max_step=0.05), so the lift
+    # never leaves sheet 0: θ_R = θ_raw, with no sheet-jump slips (Δw = 0).
+    # Taking it from t alone (no unwrap state carried between calls) keeps rhs
+    # pure, so LSODA re-evaluating a step cannot perturb it.
+    theta_R = theta_raw
+    delta_w = 0.0
 
     # ── Boxed equation ───────────────────────────────────────────
+    # α_G|I|e^{iθ_R} − μ_G G̃, split into real and imaginary parts
     aG = alpha_G(S)
     mG = mu_G(S)
-    dG = aG * I_amp * np.exp(1j * theta_R) - mG * G
-    dG_re = dG.real
-    dG_im = dG.imag
+    drive = aG * I_amp
+    dG_re = drive * np.cos(theta_R) - mG * G_re
+    dG_im = drive * np.sin(theta_R) - mG * G_im
 
     # ── Entropy ODE (2nd-law safe) ───────────────────────────────
     G_inv_re = G_re / (G_re**2 + G_im**2 + 1e-10)  # Re(1/G̃)
@@ -132,10 +154,12 @@ def rhs(t, y):
     S_clamped = min(S, 50.0)
     dS = dissipation + kappa * delta_w - gamma * (S_clamped - Seq)
 
-    # Track cumulative slip events
-    dw_cum = float(delta_w)
-
-    return [dG_re, dG_im, dS, dw_cum]
+    out = np.empty(4)
+    out[0] = dG_re
+    out[1] = dG_im
+    out[2] = dS
+    out[3] = delta_w  # cumulative slip events
+    return out
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -156,8 +180,8 @@ w_cum    = sol.y[3]
 G_mag    = np.sqrt(G_re**2 + G_im**2)
 
 # Compute ε_eff(t) and m_eff(t)
-eps_arr  = np.array([eps_of_t(ti) for ti in t_sol])
-meff_arr = np.array([m_eff_of_eps(e) for e in eps_arr])
+eps_arr  = np.clip(t_sol / t_ramp * eps_max, 0.0, eps_max)  # eps_of_t over the grid
+meff_arr = m_eff_of_eps(eps_arr)
 
 print(f"Integration done: {len(t_sol)} steps, t ∈ [{t_sol[0]:.1f}, {t_sol[-1]:.1f}]")
 
@@ -174,15 +198,16 @@ print(f"\nFHS Chern trace ({K} samples, N=31)  ε_c = √3/2 ≈ {eps_c:.4f}")
 print(f"{'t':>8s}  {'ε_eff':>8s}  {'m_eff':>9s}  {'|G̃|':>7s}  {'S':>7s}  {'C':>3s}")
 print("─" * 52)
 
-for idx in sample_idx:
+C_samples = chern_fhs_qwz_batched(meff_arr[sample_idx], N=31)
+near_c = np.abs(eps_arr[sample_idx] - eps_c) < 0.05
+for idx, Ci, at_c in zip(sample_idx, C_samples.tolist(), near_c):
     ti = t_sol[idx]
     ei = eps_arr[idx]
     mi = meff_arr[idx]
     Gi = G_mag[idx]
     Si = S_sol[idx]
-    Ci = chern_fhs_qwz(mi, N=31)
     chern_trace.append((ti, ei, mi, Gi, Si, Ci))
-    flag = " ◄ ε_c" if abs(ei - eps_c) < 0.05 else ""
+    flag = " ◄ ε_c" if at_c else ""
     print(f"{ti:8.2f}  {ei:8.4f}  {mi:+9.4f}  {Gi:7.4f}  {Si:7.4f}  {Ci:+3d}{flag}")
 
 
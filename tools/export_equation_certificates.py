@@ -2,12 +2,30 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from jsonio import json_loads  # noqa: E402
 
-def sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def sha256_text(*parts: str) -> str:
+    """SHA-256 of the concatenated parts, fed incrementally (no joined copy)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()
+
+
+# Canonical form hashed into metadata_hash; one shared instance instead of the
+# fresh encoder json.dumps builds for every call with non-default options.
+_CERT_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _finalize_cert(cert: dict) -> dict:
+    cert["metadata_hash"] = sha256_text(_CERT_ENCODER.encode(cert))
+    return cert
 
 
 def main() -> None:
@@ -17,14 +35,14 @@ def main() -> None:
     out_path = repo / "data" / "certificates" / "equation_certificates.json"
 
     raw = src_path.read_text(encoding="utf-8")
-    doc = json.loads(raw)
+    doc = json_loads(raw)
 
     # Also include core equations on the chain
     core_raw = ""
     core_entries: list[dict] = []
     if core_path.exists():
         core_raw = core_path.read_text(encoding="utf-8")
-        core_doc = json.loads(core_raw)
+        core_doc = json_loads(core_raw)
         core_entries = list(core_doc.get("entries", []))
 
     entries = []
@@ -36,7 +54,8 @@ def main() -> None:
         p = e.get("plausibility", 0)
         v = e.get("validation", 0)
         a = e.get("artifactCompleteness", 0)
-        score = e.get("score", int(round(((t + p + v + a) / 70.0) * 100.0)))
+        # Only derive the rubric score when the entry doesn't carry one.
+        score = e["score"] if "score" in e else int(round(((t + p + v + a) / 70.0) * 100.0))
         cert = {
             "token_id": e.get("id", ""),
             "name": e.get("name", ""),
@@ -63,9 +82,7 @@ def main() -> None:
             },
             "version": 1,
         }
-        cert_blob = json.dumps(cert, sort_keys=True, separators=(",", ":"))
-        cert["metadata_hash"] = sha256_text(cert_blob)
-        entries.append(cert)
+        entries.append(_finalize_cert(cert))
 
     # Derived equations (tagged as tier: derived)
     for e in doc.get("entries", []):
@@ -91,20 +108,19 @@ def main() -> None:
             "submitter_hash": sha256_text(e.get("submitter", "topequations-project")),
             "version": 1,
         }
-        cert_blob = json.dumps(cert, sort_keys=True, separators=(",", ":"))
-        cert["metadata_hash"] = sha256_text(cert_blob)
-        entries.append(cert)
+        entries.append(_finalize_cert(cert))
 
     payload = {
         "schema": "top-equations-certificate-v1",
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "source_file": str(src_path),
-        "source_sha256": sha256_text(raw + core_raw),
+        "source_sha256": sha256_text(raw, core_raw),
         "count": len(entries),
         "entries": entries,
     }
 
-    out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with out_path.open("w", encoding="utf-8") as fp:
+        json.dump(payload, fp, indent=2)
     print(f"wrote: {out_path}")
     print(f"certificates: {len(entries)}")
 
@@ -15,26 +15,29 @@ FIELDS = [
 
 # Match a JSON string field value on one line: "field": "..."
 # This file is formatted with each entry on one line, so this is safe.
+# One alternation covers every field so the file is scanned once; the
+# possessive quantifiers keep the string-body loop from backtracking.
+FIELD_VALUE = re.compile(
+    r'("(?:%s)"\s*+:\s*+")([^"\\]*+(?:\\.[^"\\]*+)*+)(")'
+    % "|".join(re.escape(field) for field in FIELDS)
+)
+LONE_BACKSLASH = re.compile(r"(?<!\\)\\(?!\\)")
+
 
 def escape_json_string_content(s: str) -> str:
     # Escape any backslash that isn't already escaped.
     # i.e. turn \ into \\ but leave existing \\ as-is.
-    return re.sub(r"(?<!\\)\\(?!\\)", r"\\\\", s)
-
+    return LONE_BACKSLASH.sub(r"\\\\", s)
 
-def main() -> None:
-    text = TARGET.read_text(encoding="utf-8")
 
-    for field in FIELDS:
-        pat = re.compile(rf'("{re.escape(field)}"\s*:\s*")([^"\\]*(?:\\.[^"\\]*)*)(")')
-        # The middle group is the raw string content with any escapes; we still need to ensure lone backslashes are doubled.
+def _fix_field(m: re.Match) -> str:
+    prefix, content, suffix = m.group(1), m.group(2), m.group(3)
+    return prefix + escape_json_string_content(content) + suffix
 
-        def repl(m: re.Match) -> str:
-            prefix, content, suffix = m.group(1), m.group(2), m.group(3)
-            fixed = escape_json_string_content(content)
-            return prefix + fixed + suffix
 
-        text = pat.sub(repl, text)
+def main() -> None:
+    text = TARGET.read_text(encoding="utf-8")
+    text = FIELD_VALUE.sub(_fix_field, text)
 
     TARGET.write_text(text, encoding="utf-8")
     print("Rewrote", TARGET)
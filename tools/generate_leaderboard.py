@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import json
+import sys
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from jsonio import json_loads  # noqa: E402
+
 
 def _highlight_tier(entry: dict) -> str:
     display = entry.get("display", {}) or {}
@@ -39,28 +43,45 @@ def _safe(text: str) -> str:
 
 
 def _row(cols: list[str]) -> str:
-    return "| " + " | ".join(_safe(c) for c in cols) + " |"
+    # Escape the whole row with one replace: join the cells on a sentinel,
+    # escape pipes, then turn the sentinels into column separators. Cells that
+    # contain the sentinel themselves fall back to per-cell escaping.
+    row = "\x00".join(cols)
+    if row.count("\x00") != len(cols) - 1:
+        return "| " + " | ".join([_safe(c) for c in cols]) + " |"
+    return "| " + row.replace("|", "\\|").replace("\x00", " | ") + " |"
 
 
 def generate(input_path: Path, output_path: Path) -> None:
-    data = json.loads(input_path.read_text(encoding="utf-8"))
-    entries_all = list(data.get("entries", []))
-    entries_all.sort(key=lambda e: float(e.get("score", 0)), reverse=True)
+    data = json_loads(input_path.read_bytes())
+    # Parse each score once and carry it alongside its entry (stable sort, so
+    # ties keep file order as before).
+    scored = sorted(
+        ((float(e.get("score", 0)), e) for e in data.get("entries", [])),
+        key=itemgetter(0),
+        reverse=True,
+    )
+    entries_all = [e for _, e in scored]
 
     # Display cap: only show registry entries with score >= 65.
     # Lower-scoring entries may still exist in the registry, but they won't appear
     # in the top tables.
     DISPLAY_THRESHOLD = 65
-    entries = [e for e in entries_all if float(e.get("score", 0)) >= DISPLAY_THRESHOLD]
+    entries = [e for score, e in scored if score >= DISPLAY_THRESHOLD]
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    this_month = datetime.now().strftime("%Y-%m")
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    this_month = now.strftime("%Y-%m")
 
     monthly = [e for e in entries if str(e.get("date", "")).startswith(this_month)]
 
     # Registry keeps everything, regardless of score (historical record).
-    registry = [e for e in entries_all if str(e.get("firstSeen", "")).startswith(("2025", "2026", "2027", "2028", "2029"))]
-    registry.sort(key=lambda e: str(e.get("firstSeen", "9999-99")))
+    # Stringify firstSeen once for both the filter and the sort; entries without
+    # one never pass the year filter, so they need no sort default.
+    seen = [(str(e.get("firstSeen", "")), e) for e in entries_all]
+    seen = [pair for pair in seen if pair[0].startswith(("2025", "2026", "2027", "2028", "2029"))]
+    seen.sort(key=itemgetter(0))
+    registry = [e for _, e in seen]
 
     lines: list[str] = []
     lines.append("# Equation Registry")
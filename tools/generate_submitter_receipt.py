@@ -3,11 +3,21 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from ecdsa import SECP256k1, SigningKey
 
+try:
+    import coincurve  # optional: libsecp256k1 signing, much faster than pure-Python ecdsa
+except ImportError:
+    coincurve = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from jsonio import json_loads  # noqa: E402
+
 REPO = Path(__file__).resolve().parents[1]
 
 
@@ -15,56 +25,47 @@ def sha256_text(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
-def sign_receipt(private_key_hex: str, receipt_data: dict) -> str:
-    message = json.dumps(receipt_data, sort_keys=True)
-    sk = SigningKey.from_string(bytes.fromhex(private_key_hex), curve=SECP256k1)
-    sig = sk.sign(message.encode("utf-8"))
-    return sig.hex()
-
-
-def main() -> None:
-    ap = argparse.ArgumentParser(description="Generate a signed receipt for a submitter")
-    ap.add_argument("--submission-id", required=True)
-    ap.add_argument("--signer-file", default="D:/coins2/Adaptive-Curvature-Coin/wallet.json")
-    ap.add_argument("--out-dir", default="data/certificates/receipts")
-    args = ap.parse_args()
-
-    signer = json.loads(Path(args.signer_file).read_text(encoding="utf-8"))
-    priv = signer["private_key"]
-    pub = signer["public_key"]
-
-    # Load submission data
-    submissions_path = REPO / "data" / "submissions.json"
-    submissions = json.loads(submissions_path.read_text(encoding="utf-8"))
-    entry = None
-    for e in submissions.get("entries", []):
-        if str(e.get("submissionId")) == args.submission_id:
-            entry = e
-            break
+@lru_cache(maxsize=None)
+def _signing_key(private_key_hex: str):
+    # Building the key derives its public point (a scalar multiplication), which
+    # costs about as much as a signature; batch runs reuse one key.
+    secret = bytes.fromhex(private_key_hex)
+    if coincurve is not None:
+        return coincurve.PrivateKey(secret)
+    return SigningKey.from_string(secret, curve=SECP256k1)
 
-    if not entry:
-        raise SystemExit(f"submission not found: {args.submission_id}")
 
+def sign_receipt(private_key_hex: str, receipt_data: dict) -> str:
+    message = json.dumps(receipt_data, sort_keys=True).encode("utf-8")
+    sk = _signing_key(private_key_hex)
+    if coincurve is None:
+        return sk.sign(message).hex()
+    # Same signature format as ecdsa's SigningKey.sign defaults: a SHA-1 digest
+    # (zero-padded to 32 bytes, i.e. the same integer) and raw r||s bytes, so
+    # existing verifiers keep working.
+    digest = hashlib.sha1(message).digest().rjust(32, b"\0")
+    return sk.sign_recoverable(digest, hasher=None)[:64].hex()
+
+
+def build_receipt(
+    submission_id: str,
+    entry: dict,
+    certs_by_token: dict[str, dict],
+    priv: str,
+    pub: str,
+) -> dict:
     # Load the matching equation (if promoted)
     equation_id = (entry.get("review") or {}).get("equationId", "")
-    equation_hash = ""
-    metadata_hash = ""
-    if equation_id:
-        certs_path = REPO / "data" / "certificates" / "equation_certificates.json"
-        if certs_path.exists():
-            certs = json.loads(certs_path.read_text(encoding="utf-8"))
-            for c in certs.get("entries", []):
-                if c.get("token_id") == equation_id:
-                    equation_hash = c.get("equation_hash", "")
-                    metadata_hash = c.get("metadata_hash", "")
-                    break
+    cert = certs_by_token.get(equation_id, {}) if equation_id else {}
+    equation_hash = cert.get("equation_hash", "")
+    metadata_hash = cert.get("metadata_hash", "")
 
     submitter = entry.get("submitter", "unknown")
     submitter_hash = sha256_text(submitter)
 
     receipt_data = {
         "type": "submitter_receipt",
-        "submission_id": args.submission_id,
+        "submission_id": submission_id,
         "equation_id": equation_id,
         "submitter_hash": submitter_hash,
         "equation_hash": equation_hash,
@@ -77,7 +78,7 @@ def main() -> None:
 
     signature = sign_receipt(priv, receipt_data)
 
-    receipt = {
+    return {
         **receipt_data,
         "signature": signature,
         "verify_note": (
@@ -87,16 +88,57 @@ def main() -> None:
         ),
     }
 
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Generate a signed receipt for a submitter")
+    ap.add_argument(
+        "--submission-id",
+        "--submission-ids",
+        dest="submission_ids",
+        nargs="+",
+        required=True,
+        help="One or more submission ids; all receipts are signed in a single run",
+    )
+    ap.add_argument("--signer-file", default="D:/coins2/Adaptive-Curvature-Coin/wallet.json")
+    ap.add_argument("--out-dir", default="data/certificates/receipts")
+    args = ap.parse_args()
+
+    signer = json.loads(Path(args.signer_file).read_text(encoding="utf-8"))
+    priv = signer["private_key"]
+    pub = signer["public_key"]
+
+    # Load submission data
+    submissions_path = REPO / "data" / "submissions.json"
+    submissions = json_loads(submissions_path.read_bytes())
+    entries_by_id: dict[str, dict] = {}
+    for e in submissions.get("entries", []):
+        entries_by_id.setdefault(str(e.get("submissionId")), e)
+
+    missing = [sid for sid in args.submission_ids if not entries_by_id.get(sid)]
+    if missing:
+        raise SystemExit(f"submission not found: {', '.join(missing)}")
+
+    # Certificates are shared by every receipt in the batch; read them once.
+    certs_by_token: dict[str, dict] = {}
+    certs_path = REPO / "data" / "certificates" / "equation_certificates.json"
+    if certs_path.exists():
+        certs = json_loads(certs_path.read_bytes())
+        for c in certs.get("entries", []):
+            certs_by_token.setdefault(c.get("token_id"), c)
+
     out_dir = REPO / args.out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
-    out_path = out_dir / f"receipt-{args.submission_id}.json"
-    out_path.write_text(json.dumps(receipt, indent=2) + "\n", encoding="utf-8")
-
-    print(f"receipt: {out_path}")
-    print(f"submitter_hash: {submitter_hash}")
-    print(f"equation_id: {equation_id}")
-    print(f"signature: {signature[:24]}...")
-    print(json.dumps(receipt, indent=2))
+    for submission_id in args.submission_ids:
+        entry = entries_by_id[submission_id]
+        receipt = build_receipt(submission_id, entry, certs_by_token, priv, pub)
+        out_path = out_dir / f"receipt-{submission_id}.json"
+        out_path.write_text(json.dumps(receipt, indent=2) + "\n", encoding="utf-8")
+
+        print(f"receipt: {out_path}")
+        print(f"submitter_hash: {receipt['submitter_hash']}")
+        print(f"equation_id: {receipt['equation_id']}")
+        print(f"signature: {receipt['signature'][:24]}...")
+        print(json.dumps(receipt, indent=2))
 
 
 if __name__ == "__main__":
@@ -7,10 +7,12 @@ This is intentionally conservative (strict-ish filters) to reduce noise.
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import re
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Iterable
@@ -32,6 +34,7 @@ INLINE_LATEX = re.compile(r"\$(?!\$)(.+?)(?<!\\)\$", re.DOTALL)
 
 CODE_EQ = re.compile(r"^\s*[^#\n]{0,220}?=.{1,220}$")
 MATH_HINT = re.compile(r"[\d\)\(\]\[\+\-\*/\^]|(np\.|math\.)|(sin|cos|tan|exp|log)")
+_WS_RE = re.compile(r"\s+")
 
 EXTS = {".md", ".tex", ".py", ".txt"}
 SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "node_modules", ".openclaw", "media", "out", "runs"}
@@ -48,10 +51,7 @@ class EqHit:
 
 
 def normalize(eq: str) -> str:
-    s = eq.strip()
-    s = re.sub(r"\s+", " ", s)
-    s = s.strip("$")
-    return s
+    return _WS_RE.sub(" ", eq.strip()).strip("$")
 
 
 def digest(eq: str) -> str:
@@ -73,56 +73,90 @@ def extract_from_text(text: str) -> list[str]:
 
 
 def iter_files(root: Path) -> Iterable[Path]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        d = Path(dirpath)
-        dirnames[:] = [n for n in dirnames if n not in SKIP_DIRS]
-        for fn in filenames:
-            p = d / fn
-            if p.suffix.lower() in EXTS:
-                yield p
-
-
-def harvest_files(root: Path) -> list[EqHit]:
-    out: list[EqHit] = []
-    for p in iter_files(root):
+    # Top-down like os.walk (files of a directory, then its subdirectories in
+    # listing order), but reading type info off the scandir entries.
+    stack = [os.fspath(root)]
+    while stack:
         try:
-            text = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for e in it:
+                try:
+                    is_dir = e.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if e.name not in SKIP_DIRS and not e.is_symlink():
+                        subdirs.append(e.path)
+                elif os.path.splitext(e.name)[1].lower() in EXTS:
+                    yield Path(e.path)
+        stack.extend(reversed(subdirs))
+
+
+def _scan_file(p: Path) -> list[EqHit]:
+    out: list[EqHit] = []
+    try:
+        text = p.read_text(encoding="utf-8", errors="ignore")
+    except Exception:
+        return out
+
+    for eq in extract_from_text(text):
+        n = normalize(eq)
+        if len(n) < MIN_LATEX_LEN:
             continue
+        out.append(EqHit(equation=n, kind="latex", source=str(p)))
 
-        for eq in extract_from_text(text):
-            n = normalize(eq)
-            if len(n) < MIN_LATEX_LEN:
+    if p.suffix.lower() == ".py":
+        lines = text.splitlines()
+        for i, line in enumerate(lines, start=1):
+            if not CODE_EQ.match(line):
+                continue
+            if "==" in line or "!=" in line:
+                continue
+            if not MATH_HINT.search(line):
+                continue
+            rhs = line.split("=", 1)[1].strip()
+            if len(rhs) < 5:
                 continue
-            out.append(EqHit(equation=n, kind="latex", source=str(p)))
-
-        if p.suffix.lower() == ".py":
-            lines = text.splitlines()
-            for i, line in enumerate(lines, start=1):
-                if not CODE_EQ.match(line):
-                    continue
-                if "==" in line or "!=" in line:
-                    continue
-                if not MATH_HINT.search(line):
-                    continue
-                rhs = line.split("=", 1)[1].strip()
-                if len(rhs) < 5:
-                    continue
-                out.append(EqHit(equation=line.strip(), kind="code", source=str(p), line_start=i, line_end=i))
+            out.append(EqHit(equation=line.strip(), kind="code", source=str(p), line_start=i, line_end=i))
 
     return out
 
 
+def harvest_files(root: Path, jobs: int = 1) -> list[EqHit]:
+    out: list[EqHit] = []
+    # Files are independent; threads overlap the reads on a cold cache. map()
+    # returns per-file hits in walk order, so dedup keeps the same first hit.
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for hits in pool.map(_scan_file, iter_files(root)):
+                out.extend(hits)
+    else:
+        for p in iter_files(root):
+            out.extend(_scan_file(p))
+    return out
+
+
 def main() -> None:
-    hits = harvest_files(ROOT_REPOS)
+    ap = argparse.ArgumentParser(description="Harvest equations from local RDM3DC repos")
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="Read and scan this many files concurrently (default: 1)")
+    args = ap.parse_args()
 
+    hits = harvest_files(ROOT_REPOS, jobs=args.jobs)
+
+    # Dedup on the equation text itself (the digest is a function of it) and
+    # hash only the survivors; the sha1 stays the entry's stable id downstream.
     uniq: dict[str, EqHit] = {}
     for h in hits:
-        h.sha1 = digest(h.equation)
-        if h.sha1 not in uniq:
-            uniq[h.sha1] = h
+        uniq.setdefault(h.equation, h)
 
     uniq_list = list(uniq.values())
+    for h in uniq_list:
+        h.sha1 = digest(h.equation)
 
     by_kind: dict[str, int] = {}
     for h in uniq_list:
@@ -0,0 +1,24 @@
+"""Shared JSON parsing for the tools scripts.
+
+orjson is used when installed and the stdlib parser covers input it rejects
+(NaN/Infinity, huge ints). Only reads go through here: writes stay on
+json.dumps so the formatting of committed, hashed and signed data never churns.
+"""
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(raw: bytes | str):
+    """Parse a JSON document; both parsers take bytes directly, without a str copy."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
@@ -19,21 +19,48 @@ Outputs:
   - Console table of r_b vs coupling and noise.
 
 Usage:
-    python tools/langevin_parity_lock.py
+    python tools/langevin_parity_lock.py [--jobs N]
 """
 
 from __future__ import annotations
 
+import argparse
 import math
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from pathlib import Path
 
+try:
+    from numba import njit
+except ImportError:  # optional: without numba the step kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 REPO = Path(__file__).resolve().parents[1]
 
 
 # ══════════════════════════════════════════════════════════════════
 # Core SDE integrator (Euler–Maruyama)
 # ══════════════════════════════════════════════════════════════════
+@njit(cache=True)
+def _em_fixed(phi, noise, Delta, lamG, dt):
+    """Euler–Maruyama steps for fixed G (pure Adler + noise), in place."""
+    for i in range(1, phi.shape[0]):
+        phi[i] = phi[i - 1] + (Delta - lamG * math.sin(phi[i - 1])) * dt + noise[i]
+
+
+@njit(cache=True)
+def _em_arp(phi, G, noise, Delta, lam, alpha, mu, G0, dt):
+    """Euler–Maruyama steps with ARP-evolving G, in place."""
+    for i in range(1, phi.shape[0]):
+        sp = math.sin(phi[i - 1])
+        phi[i] = phi[i - 1] + (Delta - lam * G[i - 1] * sp) * dt + noise[i]
+        activity = G[i - 1] * abs(sp)
+        G[i] = max(G[i - 1] + (alpha * activity - mu * (G[i - 1] - G0)) * dt, 1e-6)
+
+
 def simulate(
     Delta: float = 1.0,
     lam: float = 1.0,
@@ -57,24 +84,19 @@ def simulate(
     N = int(T / dt)
     sqrt_2D_dt = math.sqrt(2 * D * dt) if D > 0 else 0.0
 
-    phi = np.zeros(N)
-    G = np.zeros(N)
-
-    phi[0] = 0.0
-    G[0] = G_fixed if G_fixed is not None else G0
+    # Draw every step's noise up front (same stream as one draw per step).
+    noise = np.zeros(N)
+    if D > 0:
+        noise[1:] = rng.standard_normal(N - 1) * sqrt_2D_dt
 
-    for i in range(1, N):
-        sp = math.sin(phi[i - 1])
-        drift_phi = Delta - lam * G[i - 1] * sp
-        noise = rng.standard_normal() * sqrt_2D_dt if D > 0 else 0.0
-        phi[i] = phi[i - 1] + drift_phi * dt + noise
-
-        if G_fixed is not None:
-            G[i] = G_fixed
-        else:
-            activity = G[i - 1] * abs(sp)
-            G[i] = G[i - 1] + (alpha * activity - mu * (G[i - 1] - G0)) * dt
-            G[i] = max(G[i], 1e-6)
+    phi = np.zeros(N)
+    if G_fixed is not None:
+        G = np.full(N, float(G_fixed))
+        _em_fixed(phi, noise, Delta, lam * G_fixed, dt)
+    else:
+        G = np.zeros(N)
+        G[0] = G0
+        _em_arp(phi, G, noise, Delta, lam, alpha, mu, G0, dt)
 
     # ── Parity from unwrapped phase (net winding) ────────────────
     w = np.floor((phi - phi[0]) / math.pi).astype(int)
@@ -96,10 +118,22 @@ def simulate(
     }
 
 
+def _sweep_point(job: tuple[float, float, float, float, float]) -> float:
+    """r_b for one Part A grid point; module-level so worker processes can run it."""
+    lG, D, Delta, T, dt = job
+    # lam=1, G_fixed=lG → effective coupling = lG
+    return simulate(Delta=Delta, lam=1.0, G_fixed=lG, D=D, T=T, dt=dt, seed=42)["r_b"]
+
+
 # ══════════════════════════════════════════════════════════════════
 # Main
 # ══════════════════════════════════════════════════════════════════
 def main() -> None:
+    ap = argparse.ArgumentParser(description="Langevin parity-lock simulation (Paper I Eq. 7)")
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="Run the Part A sweep in this many worker processes (default: 1)")
+    args = ap.parse_args()
+
     Delta = 1.0
     T = 300.0
     dt = 0.005
@@ -126,14 +160,21 @@ def main() -> None:
 
     sweep_data = {D: [] for D in D_levels}  # λG → r_b
 
+    # Every grid point is an independent fixed-seed trajectory, so they can run
+    # in worker processes; map() returns them in grid order either way.
+    jobs = [(lG, D, Delta, T, dt) for lG in lam_G_values for D in D_levels]
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            r_b_values = iter(list(pool.map(_sweep_point, jobs)))
+    else:
+        r_b_values = map(_sweep_point, jobs)
+
     for lG in lam_G_values:
         line = f"{lG:6.2f}"
         for D in D_levels:
-            # lam=1, G_fixed=lG → effective coupling = lG
-            res = simulate(Delta=Delta, lam=1.0, G_fixed=lG,
-                           D=D, T=T, dt=dt, seed=42)
-            sweep_data[D].append(res["r_b"])
-            line += f"  {res['r_b']:10.4f}"
+            r_b = next(r_b_values)
+            sweep_data[D].append(r_b)
+            line += f"  {r_b:10.4f}"
         print(line)
 
     print(f"\n|Δ|/π = {r_b_1pi:.4f}  (slip floor)")